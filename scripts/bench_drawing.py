@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+# Benchmark of the drawing of a terminal block element, serialized as the
+# generator does. Compares the drawing element by element
+# (drawTerminalBlock) with the XML written directly from the column
+# templates (drawTerminalBlockBytes), and checks that both give the same
+# XML. The uuids are the stable ones, so the XML must be the same byte by
+# byte. The former uuid1() per label is measured apart.
+#
+#   python3 scripts/bench_drawing.py [num_of_terminals] [repeat]
+
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+import uuid as uuidly
+import xml.etree.ElementTree as etree
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.generator import DEFAULT_SETTINGS
+from src.terminal import Terminal
+from src.terminalblock import TerminalBlock
+from src.uuids import UuidSource
+
+
+def synthetic(n):
+    """n terminals of a block with every type, bridges and hoses"""
+    rnd = random.Random(0)
+    return [Terminal(uuid=str(i), block_name='X1', terminal_name=str(i + 1), \
+            terminal_xref='{}-C{}'.format(i // 20, i % 8), cable='W{}'.format(i % 97), \
+            terminal_pos=i + 1, terminal_type=rnd.choice(['STANDARD', 'GROUND', 'FUSE']), \
+            hose=rnd.choice(['', '', '-W{}'.format(i // 10)]), conductor=str(i % 7), \
+            bridge=rnd.choice(['', '', '|'])) for i in range(n)]
+
+
+def best(func, repeat):
+    """Returns the best time of some runs"""
+    return best_of([func], repeat)[0]
+
+
+def best_of(funcs, repeat):
+    """Returns the best time of some runs of every function. The functions
+    run in turns, so a change of the load of the machine affects all."""
+    ret = [None] * len(funcs)
+    for i in range(repeat):
+        for j, func in enumerate(funcs):
+            start = time.perf_counter()
+            func()
+            t = time.perf_counter() - start
+            ret[j] = t if ret[j] is None else min(ret[j], t)
+    return ret
+
+
+def peak(func):
+    """Returns the peak of memory allocated while running func"""
+    tracemalloc.start()
+    func()
+    ret = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ret
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    settings = dict(DEFAULT_SETTINGS)
+    settings['-CFG_STABLE_UUIDS-'] = True
+    terminals = synthetic(n)
+    def block():  # a new one, to start the uuids again
+        return TerminalBlock('X1', terminals, settings)
+
+    ways = [('elements', lambda: etree.tostring(block().drawTerminalBlock())), \
+            ('templates', lambda: block().drawTerminalBlockBytes())]
+
+    old = ways[0][1]()
+    for name, func in ways[1:]:
+        assert func() == old  # same drawing
+    labels = old.count(b'<dynamic_text')
+    print('{} terminals, {} elements, {} labels'.format(n, \
+            old.count(b'<') - old.count(b'</'), labels))
+
+    times = dict(zip([x[0] for x in ways], best_of([x[1] for x in ways], repeat)))
+    for name, func in ways:
+        print('{:<22} {:8.2f} ms {:8.0f} KB peak'.format(name, \
+                times[name] * 1000, peak(func) / 1024))
+
+    t_uuid1 = best(lambda: ['{' + uuidly.uuid1().urn[9:] + '}' \
+            for i in range(labels)], repeat)
+    source = UuidSource()
+    t_uuids = best(lambda: [source.new() for i in range(labels)], repeat)
+    print('uuids of the labels    {:8.2f} ms, were {:.2f} ms with uuid1()'.format( \
+            t_uuids * 1000, t_uuid1 * 1000))
+    for name, t in list(times.items())[1:]:
+        print('{}: x{:.1f} faster than elements'.format(name, times['elements'] / t))
+
+
+if __name__ == '__main__':
+    main()
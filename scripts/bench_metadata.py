@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+# Micro-benchmark of the parsing of the 'function' field of the terminals.
+# Compares the former eight re.search() per terminal with src.metadata.
+#
+#   python3 scripts/bench_metadata.py [num_of_strings]
+
+
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src import metadata
+
+
+def legacy_parse(meta):
+    """The former QETProject._getElementMetadata, without the XML part"""
+    ret = {}
+    if meta is None:
+        meta = ''
+    foo  = re.search(r'%p(\d+)(%|$)', meta)  # %p
+    ret['terminal_pos'] = foo.group(1) if foo else ''
+    foo = re.search(r'%t([^%]*)(%|$)', meta)  # %t
+    tp = ''
+    if foo: tp = foo.group(1)
+    ret['terminal_type'] = foo.group(1) if tp!='' else 'STANDARD'
+    foo  = re.search(r'%h([^%]*)(%|$)', meta)  # %h
+    ret['hose'] = foo.group(1) if foo else ''
+    foo  = re.search(r'%n([^%]*)(%|$)', meta)  # %n
+    ret['conductor'] = foo.group(1) if foo else ''
+    foo  = re.search(r'%b([^%]*)(%|$)', meta)  # %b
+    ret['bridge'] = foo.group(1) if foo else ''
+    foo = re.search(r'%r(\d+)(%|$)', meta)  # %r
+    tp = ''
+    if foo: tp = foo.group(1)
+    ret['num_reserve'] = foo.group(1) if tp != '' else 0
+    foo = re.search(r'%z([^%]*)(%|$)', meta)  # %z
+    ret['reserve_positions'] = foo.group(1) if foo else ''
+    foo = re.search(r'%s(\d+)(%|$)', meta)  # %s
+    tp = ''
+    if foo: tp = foo.group(1)
+    ret['size'] = foo.group(1) if tp != '' else 30
+    return ret
+
+
+def synthetic(n):
+    """Function fields as written by the current and older versions"""
+    rnd = random.Random(0)
+    ret = []
+    for i in range(n):
+        m = metadata.Metadata(rnd.randint(1, 200), \
+                rnd.choice(['STANDARD', 'GROUND', 'FUSE']), \
+                rnd.choice(['', '-W1', '-W23']), rnd.choice(['', '1', 'bk']), \
+                rnd.choice(['', '|']), rnd.randint(0, 3), '', 30)
+        s = metadata.serialize(m)
+        if i % 4 == 0:  # older versions: %p%t%h%n%b%
+            s = s[:s.index('%r')] + '%'
+        elif i % 10 == 1:  # unordered tags
+            s = '%' + '%'.join(reversed(s[1:].split('%')))
+        ret.append(s)
+    return ret
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = synthetic(n)
+
+    for x in data[:1000]:  # both agree
+        a, b = legacy_parse(x), metadata.parse(x)
+        assert a['terminal_type'] == b.terminal_type and a['hose'] == b.hose
+        assert metadata.parse(metadata.serialize(b)) == b
+
+    for name, func in (('legacy re.search x8', legacy_parse), \
+            ('metadata.parse', metadata.parse)):
+        t = min(timeit.repeat(lambda: [func(x) for x in data], number=1, repeat=3))
+        print('{:<22} {:8.3f} s  {:6.2f} us/terminal'.format(name, t, t / n * 1e6))
+
+
+if __name__ == '__main__':
+    main()
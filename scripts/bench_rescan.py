@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+# Benchmark of the rescan of a project after a change in one folio.
+# Opens a copy of the project with an empty ScanCache, changes one
+# <diagram> and opens it again, so only that folio is parsed. Checks that
+# the terminals are the same as a full scan without cache.
+#
+#   python3 scripts/bench_rescan.py project.qet [num_of_folio]
+
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.qetproject import QETProject
+from src.scancache import ScanCache
+
+
+def open_project(filename, cache=None):
+    """Returns the project opened and the seconds spent"""
+    start = time.perf_counter()
+    project = QETProject(filename, cache=cache)
+    return project, time.perf_counter() - start
+
+
+def change_folio(filename, folio):
+    """Adds an attribute to the start tag of a <diagram>"""
+    with open(filename, 'rb') as f:
+        xml = f.read()
+    match = list(re.finditer(rb'<diagram[\s>]', xml))[folio]
+    pos = match.start() + len(b'<diagram')
+    with open(filename, 'wb') as f:
+        f.write(xml[:pos] + b' edited="1"' + xml[pos:])
+
+
+def main():
+    source = sys.argv[1]
+    folio = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    with tempfile.TemporaryDirectory() as folder:
+        filename = os.path.join(folder, os.path.basename(source))
+        shutil.copy(source, filename)
+        cache = ScanCache(os.path.join(folder, 'cache'))
+
+        project, t_cold = open_project(filename, cache)
+        change_folio(filename, folio)
+        project, t_rescan = open_project(filename, cache)
+        full, t_full = open_project(filename)
+
+        assert [x.values() for x in project.terminals] == \
+                [x.values() for x in full.terminals]  # same terminals
+        print('{} folios, {} terminals'.format(len(project._diagrams), \
+                len(project.terminals)))
+        for name, t in (('first open', t_cold), ('full scan', t_full), \
+                ('rescan', t_rescan)):
+            print('{:<12} {:8.3f} s'.format(name, t))
+        print('parse {:.3f} s, scan {:.3f} s, x{:.1f} faster'.format( \
+                project.timings['parse'], project.timings['scan'], t_full / t_rescan))
+
+
+if __name__ == '__main__':
+    main()
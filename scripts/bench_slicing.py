@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+# Benchmark of the slicing of the terminals into terminal block elements.
+# Compares the former loop of create_terminal_blocks, quadratic, with
+# src.generator.iter_blocks.
+#
+#   python3 scripts/bench_slicing.py [num_of_terminals] [split]
+
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.generator import iter_blocks
+
+
+def legacy_slicing(terminals, tb_list, max_tb_length):
+    """The former loop of create_terminal_blocks, without the drawing"""
+    ret = []
+    filtered_tb = [ t for t in terminals if t['block_name'] in tb_list]
+    memo_tb_name = filtered_tb[0]['block_name']
+    current_tb = []
+    tb_done = []
+    for t in filtered_tb:
+        if t['block_name'] == memo_tb_name and len(current_tb) < int(max_tb_length):
+            current_tb.append(t)
+        else:
+            current_tb_name = current_tb[0]['block_name']
+            tb_done.append( current_tb_name )
+            ret.append( (current_tb_name, tb_done.count( current_tb_name), \
+                    len([1 for x in filtered_tb if x['block_name'] == current_tb_name]) >  max_tb_length, \
+                    current_tb) )
+            current_tb = [t]
+            memo_tb_name = current_tb[0]['block_name']
+    current_tb_name = current_tb[0]['block_name']
+    tb_done.append( current_tb_name )
+    ret.append( (current_tb_name, tb_done.count( t['block_name'] ), \
+            len([1 for x in filtered_tb if x['block_name'] == current_tb_name]) >  max_tb_length, \
+            current_tb) )
+    return ret
+
+
+def synthetic(n):
+    """Terminals sorted by block, blocks of 1 to 120 terminals"""
+    rnd = random.Random(0)
+    ret = []
+    block = 0
+    while len(ret) < n:
+        block += 1
+        for i in range(rnd.randint(1, 120)):
+            ret.append({'block_name': 'X{}'.format(block), \
+                    'terminal_name': str(i + 1)})
+    return ret[:n]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    split = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    terminals = synthetic(n)
+    tb_list = list(dict.fromkeys(t['block_name'] for t in terminals))
+    print('{} terminals, {} terminal blocks, split every {}'.format( \
+            n, len(tb_list), split))
+
+    start = time.perf_counter()
+    new = list(iter_blocks(terminals, tb_list, split))
+    t_new = time.perf_counter() - start
+
+    start = time.perf_counter()
+    old = legacy_slicing(terminals, tb_list, split)
+    t_old = time.perf_counter() - start
+
+    assert new == old  # same elements
+    for name, t in (('legacy loop', t_old), ('iter_blocks', t_new)):
+        print('{:<12} {:8.3f} s'.format(name, t))
+    print('{} elements, x{:.0f} faster'.format(len(new), t_old / t_new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+# Benchmark of the start of the plugin, measured with python -X importtime
+# in a new interpreter, as QET launches it.
+#   - splash: import of src.main, until the splash window can be shown.
+#     Fails if it takes more than the target or imports a module that is
+#     only needed later (see LATE).
+#   - window: the modules imported to read the project and show the
+#     main window, for reference.
+# PySimpleGUI itself is not measured, it is imported on first use.
+#
+#   python3 scripts/bench_startup.py [target_ms] [repeat]
+
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+TARGET_MS = 60  # import of src.main
+LATE = ['PySimpleGUI', 'tkinter', 'src.qetproject', 'src.generator', \
+        'src.assets', 'multiprocessing', 'xml.sax.saxutils']
+SPLASH = 'import src.main'
+WINDOW = SPLASH + '; import src.assets, src.qetproject, src.scancache, ' \
+        'src.tablemodel, src.tableview, src.generator'
+
+
+def importtime(code):
+    """Runs 'code' in a new interpreter with -X importtime.
+    @return: [(module, cumulative us, level)] of the modules imported, in
+        the order of the report: the modules imported by one go before"""
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # measure with .pyc, as installed
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], \
+            cwd=ROOT, env=env, stderr=subprocess.PIPE, universal_newlines=True)
+    if proc.returncode:
+        sys.exit(proc.stderr.splitlines()[-1])
+    ret = []
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            us, cumulative, name = line[12:].split('|')
+            if cumulative.strip().isdigit():
+                level = (len(name) - len(name.lstrip()) - 1) // 2
+                ret.append( (name.strip(), int(cumulative), level) )
+    return ret
+
+
+def total_ms(modules, names):
+    """Sum of the cumulative time of the top level modules 'names', in ms"""
+    return sum(us for name, us, level in modules \
+            if level == 0 and name in names) / 1000
+
+
+def children(modules, parent):
+    """Returns the modules imported directly by a top level module"""
+    names = [x[0] for x in modules]
+    ret = []
+    for name, us, level in reversed(modules[:names.index(parent)]):
+        if level == 0:
+            break
+        if level == 1:
+            ret.append( (name, us) )
+    return ret
+
+
+def best(code, names, repeat):
+    """Returns the time of the fastest run, in ms, and its modules"""
+    runs = [importtime(code) for i in range(repeat)]
+    runs = [(total_ms(x, names), x) for x in runs]
+    return min(runs, key=lambda x: x[0])
+
+
+def main():
+    target = float(sys.argv[1]) if len(sys.argv) > 1 else TARGET_MS
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    importtime(WINDOW)  # compiles the .pyc
+
+    t_splash, modules = best(SPLASH, ['src.main'], repeat)
+    print('import src.main {:7.1f} ms (target {:.0f} ms)'.format(t_splash, target))
+    for name, us in sorted(children(modules, 'src.main'), key=lambda x: -x[1]):
+        print('  {:<14} {:7.1f} ms'.format(name, us / 1000))
+
+    roots = ['src.main', 'src.assets', 'src.qetproject', 'src.scancache', \
+            'src.tablemodel', 'src.tableview', 'src.generator']
+    t_window, window = best(WINDOW, roots, repeat)
+    print('main window     {:7.1f} ms'.format(t_window))
+
+    imported = [x[0] for x in modules]
+    late = [x for x in LATE if x in imported]
+    if late:
+        print('imported before the splash: {}'.format(', '.join(late)))
+    if late or t_splash > target:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+# Benchmark of the record of a terminal. Compares the former dicts with
+# src.terminal.Terminal on a synthetic project: memory of the list of
+# terminals, sorting like QETProject and the field reads of the drawing.
+#
+#   python3 scripts/bench_terminal.py [num_of_terminals]
+
+
+import gc
+import operator
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.terminal import FIELDS, Terminal
+
+
+def synthetic(n, make):
+    """n terminals in blocks of 50, built by 'make' from keyword fields"""
+    return [make(uuid='{{{:032x}}}'.format(i), block_name='X{}'.format(i // 50), \
+            terminal_name=str(i % 50 + 1), terminal_xref='{}-C{}'.format(i // 300, i % 8), \
+            cable='W{}'.format(i % 97), terminal_pos=i % 50 + 1, \
+            terminal_type='STANDARD', hose='', conductor='', bridge='', \
+            num_reserve=0, reserve_positions='', size=30) for i in range(n)]
+
+
+def measure(n, make):
+    """Returns (bytes, seconds to build, seconds to sort, seconds to read)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    terminals = synthetic(n, make)
+    t_build = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    getter = operator.attrgetter if make is Terminal else operator.itemgetter
+    start = time.perf_counter()
+    terminals.sort(key=getter('terminal_pos'))
+    terminals.sort(key=getter('block_name'), reverse=True)
+    t_sort = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if make is Terminal:  # like TerminalBlock.drawTerminalBlock
+        for t in terminals:
+            (t.terminal_name, t.terminal_xref, t.terminal_type, t.bridge, \
+                    t.cable, t.hose, t.conductor)
+    else:
+        for t in terminals:
+            (t['terminal_name'], t['terminal_xref'], t['terminal_type'], \
+                    t['bridge'], t['cable'], t['hose'], t['conductor'])
+    t_read = time.perf_counter() - start
+    return size, t_build, t_sort, t_read
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print('{} terminals, {} fields'.format(n, len(FIELDS)))
+    res = {}
+    for name, make in (('dict', dict), ('Terminal', Terminal)):
+        res[name] = measure(n, make)
+        size, t_build, t_sort, t_read = res[name]
+        print('{:<9} {:7.1f} MB  build {:6.3f} s  sort {:6.3f} s  read {:6.3f} s'.format( \
+                name, size / 2**20, t_build, t_sort, t_read))
+    print('memory x{:.2f} smaller, read x{:.2f} faster'.format( \
+            res['dict'][0] / res['Terminal'][0], res['dict'][3] / res['Terminal'][3]))
+
+
+if __name__ == '__main__':
+    main()
@@ -19,7 +19,9 @@ setup(
     package_data={'templates' : ['borne.elmt']},
 
                                        #name_of_executable = folder.module:function_to_execute
-    entry_points={'console_scripts': ['qet_tb_generator=src.main:main']},
+    entry_points={'console_scripts': ['qet_tb_generator=src.main:main', \
+            'qet_tb_generator_cli=src.cli:main', \
+            'qet_tb_generator_batch=src.batch:main']},
     install_requires=[],
     keywords='qelectrotech terminal block electric',
 
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+"""Generates the terminal blocks of all the QET projects in some folders,
+one process per CPU:
+
+    qet_tb_generator_batch projects/ [-j 8] [--report report.json]
+
+Every project is done in its own process, so an error in a project is
+reported and the others go on. The report has one entry per project with
+its timings (see generator.generate) or its error.
+"""
+
+
+# Imports
+import logging as log
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.generator import PHASES, read_settings, get_backup_name, \
+        is_backup_name, generate
+
+
+
+def find_projects(paths, pattern='*.qet'):
+    """Returns the QET projects in 'paths', biggest first so the long
+    ones do not end the batch alone in a process. The backups of the
+    projects found in the folders are skipped, see get_backup_name.
+    @param paths: list of files or folders, searched recursively
+    @param pattern: filename pattern of the projects
+    @return: list of files"""
+
+    found = []
+    for path in paths:
+        if os.path.isfile(path):
+            found.append(path)
+            continue
+        for folder, dirs, files in os.walk(path):
+            dirs.sort()
+            found.extend(os.path.join(folder, f) for f in sorted(files) \
+                    if fnmatch.fnmatch(f, pattern) and \
+                    not is_backup_name(os.path.join(folder, f)))
+    return sorted(dict.fromkeys(found), key=os.path.getsize, reverse=True)
+
+
+
+def generate_project(qet_file, settings, backup=False):
+    """Generates all the terminal blocks of a project. Runs in the worker
+    processes, so it never raises.
+    @param qet_file: QET project file
+    @param settings: dict of settings
+    @param backup: True to keep the previous file with an increment suffix
+    @return: dict with the 'project', its 'status' ('ok' or 'error') and
+        the timings or the 'error'"""
+
+    try:
+        stats = generate(qet_file, None, settings, \
+                backup=get_backup_name(qet_file) if backup else None, \
+                workers=1)  # already one process per project
+        return dict(stats, project=qet_file, status='ok')
+    except Exception as e:
+        return {'project': qet_file, 'status': 'error', \
+                'error': '{}: {}'.format(type(e).__name__, e), \
+                'traceback': traceback.format_exc()}
+
+
+
+def run(projects, settings, workers=None, backup=False, progress=None):
+    """Generates the terminal blocks of every project in a pool of processes.
+    @param projects: list of QET project files
+    @param settings: dict of settings, the same for all projects
+    @param workers: num of processes. None for one per CPU
+    @param backup: True to keep the previous files with an increment suffix
+    @param progress: function called with the result of every project
+        when it ends
+    @return: list of results of generate_project, in the order of 'projects'"""
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(generate_project, p, settings, backup): p \
+                for p in projects}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:  # the worker died
+                result = {'project': futures[future], 'status': 'error', \
+                        'error': '{}: {}'.format(type(e).__name__, e)}
+            results[result['project']] = result
+            if progress:
+                progress(result)
+    return [results[p] for p in projects]
+
+
+
+def get_summary(results, wall):
+    """Returns the totals of a batch.
+    @param results: list returned by run()
+    @param wall: seconds spent by the batch
+    @return: dict"""
+
+    done = [r for r in results if r['status'] == 'ok']
+    summary = {
+        'projects': len(results),
+        'ok': len(done),
+        'errors': len(results) - len(done),
+        'blocks': sum(r['blocks'] for r in done),
+        'terminals': sum(r['terminals'] for r in done),
+        'wall': wall,
+    }
+    for k in PHASES + ['total']:  # cpu seconds, added for all projects
+        summary[k] = sum(r[k] for r in done)
+    summary['speedup'] = summary['total'] / wall if wall else 0
+    return summary
+
+
+
+def get_args(argv=None):
+    """Returns the arguments of the command line"""
+
+    parser = argparse.ArgumentParser(prog='qet_tb_generator_batch', \
+            description='Generates the terminal blocks of all the ' \
+            'QElectroTech projects in some folders.')
+    parser.add_argument('paths', nargs='+', metavar='PATH', \
+            help='QET project or folder to search for projects')
+    parser.add_argument('-p', '--pattern', default='*.qet', \
+            help='filename of the projects. Default: %(default)s')
+    parser.add_argument('-j', '--jobs', type=int, metavar='N', \
+            help='num of processes. One per CPU by default')
+    parser.add_argument('-s', '--settings', metavar='FILE', \
+            help='json file with the settings. ' \
+            'The ones saved by the GUI by default.')
+    parser.add_argument('--split', type=int, metavar='N', \
+            help='max. terminals per terminal block')
+    parser.add_argument('--backup', action='store_true', \
+            help='keep the previous files with an increment suffix')
+    parser.add_argument('--stable-uuids', action='store_true', \
+            help='same uuids every time a terminal block is generated')
+    parser.add_argument('-r', '--report', metavar='FILE', \
+            help='json file to write the report')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    return parser.parse_args(argv)
+
+
+
+def main(argv=None):
+    args = get_args(argv)
+    log.basicConfig(level=log.INFO if args.verbose else log.WARNING, \
+            format='%(asctime)s %(levelname)-8s %(message)s', datefmt='%H:%M:%S')
+
+    settings = read_settings(args.settings)
+    if args.split:
+        settings['-CFG_SPLIT-'] = str(args.split)
+    if args.stable_uuids:
+        settings['-CFG_STABLE_UUIDS-'] = True
+    projects = find_projects(args.paths, args.pattern)
+
+    def progress(result):
+        if result['status'] == 'ok':
+            print('{project}: {blocks} blocks, {total:.3f}s'.format(**result))
+        else:
+            print('{project}: ERROR {error}'.format(**result), file=sys.stderr)
+
+    start = time.perf_counter()
+    results = run(projects, settings, args.jobs, args.backup, progress)
+    summary = get_summary(results, time.perf_counter() - start)
+
+    print('{projects} projects ({errors} errors), {blocks} blocks, ' \
+            '{terminals} terminals in {wall:.3f}s. ' \
+            'CPU {total:.3f}s, speedup x{speedup:.1f}'.format(**summary))
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump({'summary': summary, 'projects': results}, f, indent=1)
+    return 1 if summary['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+"""Command line version of the plugin. Generates the terminal blocks of a
+QET project without GUI, using the config saved in the terminals:
+
+    qet_tb_generator_cli project.qet [-b X1 -b X2] [--split 20]
+
+The seconds spent in every phase (parse, scan, draw, write) are printed.
+"""
+
+
+# Imports
+import logging as log
+import argparse
+import json
+import sys
+
+from src.generator import PHASES, read_settings, get_backup_name, generate
+
+
+
+def get_args(argv=None):
+    """Returns the arguments of the command line"""
+
+    parser = argparse.ArgumentParser(prog='qet_tb_generator_cli', \
+            description='Generates the terminal blocks of a QElectroTech ' \
+            'project without GUI.')
+    parser.add_argument('project', help='QET project file')
+    parser.add_argument('-b', '--block', action='append', dest='blocks', \
+            metavar='NAME', help='terminal block to generate. ' \
+            'Can be repeated. All by default.')
+    parser.add_argument('-s', '--settings', metavar='FILE', \
+            help='json file with the settings. ' \
+            'The ones saved by the GUI by default.')
+    parser.add_argument('--split', type=int, metavar='N', \
+            help='max. terminals per terminal block')
+    parser.add_argument('-o', '--output', metavar='FILE', \
+            help='save to another file instead of overwriting the project')
+    parser.add_argument('--backup', action='store_true', \
+            help='keep the previous file with an increment suffix')
+    parser.add_argument('--stable-uuids', action='store_true', \
+            help='same uuids every time a terminal block is generated, ' \
+            'so the project only changes where the blocks change')
+    parser.add_argument('--json', action='store_true', \
+            help='print the timings as json')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    args = parser.parse_args(argv)
+    if args.split is not None and args.split < 1:
+        parser.error('--split must be 1 or more')
+    return args
+
+
+
+def main(argv=None):
+    args = get_args(argv)
+    log.basicConfig(level=log.DEBUG if args.verbose else log.WARNING, \
+            format='%(asctime)s %(levelname)-8s %(message)s', datefmt='%H:%M:%S')
+
+    settings = read_settings(args.settings)
+    if args.split is not None:
+        settings['-CFG_SPLIT-'] = str(args.split)
+    if args.stable_uuids:
+        settings['-CFG_STABLE_UUIDS-'] = True
+    output = args.output or args.project
+    backup = get_backup_name(output) if args.backup else None
+
+    try:
+        stats = generate(args.project, args.blocks, settings, output, backup, \
+                workers=None)  # one per CPU, the entry point is guarded
+    except Exception as e:
+        log.debug('Error generating {}'.format(args.project), exc_info=True)
+        print('{}: ERROR {}'.format(args.project, e), file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(dict(stats, project=args.project)))
+    else:
+        print('{}: {} blocks, {} terminals. {}, total {:.3f}s'.format( \
+                args.project, stats['blocks'], stats['terminals'], \
+                ', '.join('{} {:.3f}s'.format(k, stats[k]) for k in PHASES), \
+                stats['total']))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+"""Generation of the terminal blocks of a QET project, shared by the GUI
+and the command line. Nothing here depends on the GUI library.
+"""
+
+
+# Imports
+import logging as log
+import os
+import json
+import time
+from collections import Counter
+import concurrent.futures  # the process pool is imported on first use
+from itertools import groupby
+from operator import itemgetter
+
+from src.qetproject import QETProject
+from src.terminalblock import TerminalBlock
+
+
+CONFIG_FILE = 'qet_tb_generator.json'
+CACHE_FOLDER = 'qet_tb_generator.cache'  # terminals of the last projects, see ScanCache
+DEFAULT_SETTINGS = {
+    '-CFG_SPLIT-': '30',  # general
+    '-CFG_A-': '120',  # TB graphical dimensions
+    '-CFG_B-': '44',
+    '-CFG_C-': '70',
+    '-CFG_D-': '6',
+    '-CFG_E-': '160',
+    '-CFG_F-': '20',
+    '-CFG_G-': '50',
+    '-CFG_H-': '70',
+    '-CFG_I-': '80',
+    '-CFG_J-': '70',
+    '-CFG_HEAD_FONT-': '13',  # font size
+    '-CFG_TERMINAL_FONT-': '9',
+    '-CFG_XREF_FONT-': '6',
+    '-CFG_CONDUCTOR_FONT-': '6',
+    '-CFG_STABLE_UUIDS-': False,  # same uuids every time a TB is generated
+}
+PHASES = ['parse', 'scan', 'draw', 'write']  # timings of generate()
+# Less terminals are drawn in the main process. Spawning the pool takes
+# about 0.6s and a terminal about 60us, so it pays from 2 CPUs on.
+PARALLEL_MIN_TERMINALS = 20000
+
+
+
+def get_config_file():
+    """Returns the full path of the config file of the user"""
+
+    return os.path.join(
+        os.environ.get('APPDATA') or
+        os.environ.get('XDG_CONFIG_HOME') or
+        os.path.join(os.environ['HOME'], '.config'),
+        CONFIG_FILE
+    )
+
+
+
+def get_cache_folder():
+    """Returns the folder of the cache of the scanned projects, next to
+    the config file of the user"""
+
+    return os.path.join(os.path.dirname(get_config_file()), CACHE_FOLDER)
+
+
+
+def read_settings(config_file=None):
+    """Returns the settings saved in a config file. The missing ones
+    take the default value.
+    @param config_file: json file. None for the config file of the user
+    @return: dict of settings"""
+
+    settings = dict(DEFAULT_SETTINGS)
+    config_file = config_file or get_config_file()
+    if os.path.isfile(config_file):
+        with open(config_file, 'r') as f:
+            settings.update(json.load(f))
+    return settings
+
+
+
+def get_backup_name(qet_file):
+    """Returns a free filename to backup the QET project file, adding
+    an increment suffix"""
+
+    i = 1
+    full_back_path = qet_file[:qet_file.rfind('.')] + '_' + str(i) + '.qet'
+    while os.path.isfile( full_back_path) or \
+            os.path.isdir( full_back_path ) :
+        i += 1
+        full_back_path = qet_file[:qet_file.rfind('.')] + '_' + str(i) + '.qet'
+    return full_back_path
+
+
+
+def is_backup_name(qet_file):
+    """Returns True if the file looks like a backup made by
+    get_backup_name, i.e. 'name_2.qet' next to 'name.qet'"""
+
+    stem, ext = os.path.splitext(qet_file)
+    original, sep, num = stem.rpartition('_')
+    return bool(sep) and num.isdigit() and os.path.isfile(original + ext)
+
+
+
+def get_head_text(tb_name, slice_num, tb_splitted):
+    """
+    Returns the name of a TB, i.e. the text of its head
+
+    param tb_name: name of the TB
+    param tb_slice: num of the slice. Starts from 1.
+    param tb_splitted: True if the TB have several parts
+    """
+
+    if tb_splitted:
+        return "{}({})".format( tb_name, slice_num )
+    else:
+        return "{}".format( tb_name )
+
+
+
+def draw_a_TB(head_text, tb, settings):
+    """
+    Returns the element component of a TB serialized, written directly
+    with no xml nodes. Runs in the worker processes of
+    create_terminal_blocks, or in the main one.
+
+    param head_text: name of the TB
+    param tb: list of terminals
+    param settings: a dict with the settings defined in the UI
+    """
+
+    return TerminalBlock( head_text, tb, settings).drawTerminalBlockBytes()
+
+
+
+def draw_TBs(blocks, settings):
+    """
+    Returns the element component of several TB serialized. Runs in the
+    worker processes of create_terminal_blocks.
+
+    param blocks: list of (head_text, tb). See draw_a_TB
+    param settings: a dict with the settings defined in the UI
+    """
+
+    return [draw_a_TB(head_text, tb, settings) for head_text, tb in blocks]
+
+
+
+def iter_blocks(terminals, tb_list, max_tb_length):
+    """
+    Splits the terminals of some terminal blocks into the elements to
+    create. Every run of consecutive terminals of the same TB is splitted
+    every 'max_tb_length' terminals. Linear time.
+
+    @param terminals: list of Terminal, one for every terminal, in order.
+    @param tb_list: list of terminal names to generate the QET element.
+    @param (int)max_tb_length: max. terminals per element
+    @return: generator of (tb_name, slice_num, tb_splitted, terminals),
+        where slice_num starts from 1 and tb_splitted is True if the TB
+        has more than 'max_tb_length' terminals.
+    """
+
+    names = set(tb_list)
+    filtered_tb = [ t for t in terminals if t['block_name'] in names]
+    totals = Counter( t['block_name'] for t in filtered_tb )
+    slices = Counter()  # elements done of every TB
+    for tb_name, run in groupby(filtered_tb, key=itemgetter('block_name')):
+        run = list(run)
+        for i in range(0, len(run), max_tb_length):
+            slices[tb_name] += 1
+            yield tb_name, slices[tb_name], totals[tb_name] > max_tb_length, \
+                    run[i:i + max_tb_length]
+
+
+
+def create_terminal_blocks(qet_project, terminals, tb_list, max_tb_length, \
+        settings, workers=1, progress=None):
+    """
+    Generates the element component (the terminal block draw) of the
+    terminal blocks in 'tb_list' and saves the config of its terminals
+    in the project. The project is not saved to disk.
+
+    Longs TB are splited into multiple elements.
+
+    If workers is not 1 and there are PARALLEL_MIN_TERMINALS or more
+    terminals, the elements are drawn and serialized in a pool of
+    processes. Only the insertion in the project is done here, in the
+    order of the terminals. The processes are spawned, not forked, so it
+    can be called from any thread, i.e. the worker thread of the GUI: a
+    fork of a process with several threads, or with Tk, can deadlock the
+    child. Every process imports the main module again, so the script
+    that calls it with workers != 1 must guard its code with
+    if __name__ == '__main__', or the pool breaks (RuntimeError or
+    BrokenProcessPool).
+
+    @param qet_project: object
+    @param terminals: list of Terminal, one for every terminal, in order.
+    @param tb_list: list of terminal names to generate the QET element.
+    @param (int)max_tb_length: to split terminal-blocks if has a lot of terminals
+    @param settings: a dict with the settings
+    @param workers: num of processes to draw. 1 by default, to draw in
+        the main process. None for one per CPU.
+    @param progress: function called as progress(done, total, head_text)
+        every time an element is inserted in the project. It can raise an
+        exception to stop. The elements already inserted stay in the
+        project, see QETProject.discard_changes.
+    @return: number of elements created
+    """
+
+    blocks = [ (get_head_text(tb_name, slice_num, tb_splitted), tb) for \
+            tb_name, slice_num, tb_splitted, tb in \
+            iter_blocks(terminals, tb_list, int(max_tb_length)) ]
+    if not blocks:
+        return 0
+
+    # Generating the XML elements and inserting into the QET Project XML tree.
+    workers = workers or os.cpu_count() or 1
+    total = len(blocks)
+    count = sum(len(tb) for head_text, tb in blocks)  # terminals
+    if workers > 1 and count >= PARALLEL_MIN_TERMINALS:
+        log.info( "Generating {} TB in {} processes".format(total, workers) )
+        size = max(1, total // (workers * 4))
+        chunks = [blocks[i:i + size] for i in range(0, total, size)]
+        import multiprocessing
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, \
+                mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = [pool.submit(draw_TBs, chunk, settings) for chunk in chunks]
+            try:
+                done = 0
+                for chunk, future in zip(chunks, futures):  # in order
+                    for (head_text, tb), xml in zip(chunk, future.result()):
+                        qet_project.insert_tb(head_text, xml)
+                        done += 1
+                        if progress is not None:
+                            progress(done, total, head_text)
+            except BaseException:
+                for future in futures:  # not to wait for the ones not started
+                    future.cancel()
+                raise
+    else:
+        for done, (head_text, tb) in enumerate(blocks, 1):
+            log.info( "Generating TB {}".format( head_text ) )
+            qet_project.insert_tb(head_text, draw_a_TB(head_text, tb, settings))
+            if progress is not None:
+                progress(done, total, head_text)
+
+    # The Plugin info is saved in the terminal itself.
+    qet_project.update_terminals([t for head_text, tb in blocks for t in tb])
+    return len(blocks)
+
+
+
+def generate(qet_file, tb_list=None, settings=None, output=None, backup=None, \
+        workers=1):
+    """Generates the terminal blocks of a QET project and saves it, without
+    any user interaction. The config of the terminals is the one saved
+    in the project.
+    @param qet_file: QET project file
+    @param tb_list: names of the terminal blocks to generate. None for all.
+    @param settings: dict of settings. None for the ones of the user.
+    @param output: file to save the project. None to overwrite 'qet_file'
+    @param backup: if specified, the current 'output' file is kept with
+        this filename.
+    @param workers: num of processes to draw. 1 by default. With other
+        value the caller must be guarded, see create_terminal_blocks
+    @return: dict with the seconds spent in every phase (see PHASES),
+        the 'total' seconds and the number of 'blocks' and 'terminals'."""
+
+    settings = settings or read_settings()
+    start = time.perf_counter()
+
+    # parse & scan
+    qet_project = QETProject(qet_file)
+    stats = dict(qet_project.timings)
+    if tb_list is None:
+        tb_list = qet_project.tb_names
+
+    # draw
+    now = time.perf_counter()
+    terminals = qet_project.terminals
+    stats['blocks'] = create_terminal_blocks(qet_project, terminals, \
+            tb_list, int(settings['-CFG_SPLIT-']), settings, workers)
+    names = set(tb_list)
+    stats['terminals'] = len([t for t in terminals if t['block_name'] in names])
+    stats['draw'] = time.perf_counter() - now
+
+    # write
+    now = time.perf_counter()
+    qet_project.save_tb(output or qet_file, backup=backup)
+    stats['write'] = time.perf_counter() - now
+
+    stats['total'] = time.perf_counter() - start
+    return stats
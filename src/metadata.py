@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+"""Codec for the config that the plugin saves in the 'function' field
+(<elementInformation name="function">) of every terminal.
+
+The config is a string of tags, every tag is a SEP and a letter followed
+by its value:
+    %p2%tSTANDARD%hW1%n3%b|%r0%z%s30
+where:
+  - %p: terminal_pos. Position of the terminal in the terminal-block.
+  - %t: terminal_type. STANDARD, GROUND, FUSE.
+  - %h: hose. Name of the electric hose.
+  - %n: conductor. Name of the conductor in the hose.
+  - %b: bridge. '|' for a bridge to the next terminal.
+  - %r: num_reserve. Num of reserve terminals.
+  - %z: reserve_positions. Positions of the reserve terminals.
+  - %s: size. Num of terminals per terminal block.
+"""
+
+
+# Imports
+import re
+from collections import namedtuple
+
+
+SEP = '%'  # separator of the tags
+DEFAULT_SIZE = 30  # terminals per terminal block
+
+# The config of a terminal. terminal_pos is None if not specified.
+Metadata = namedtuple('Metadata', ['terminal_pos', 'terminal_type', 'hose', \
+        'conductor', 'bridge', 'num_reserve', 'reserve_positions', 'size'])
+
+TAGS = 'pthnbrzs'  # tag of every field of Metadata, same order
+NUMERIC_TAGS = 'prs'  # tags with integer values
+DEFAULT = Metadata(None, 'STANDARD', '', '', '', 0, '', DEFAULT_SIZE)
+
+# All the tags in the order written by serialize(). Older versions of the
+# plugin wrote only %p%t%h%n%b ending with a SEP.
+_CANONICAL = re.compile(r'%p(\d*)%t([^%]*)%h([^%]*)%n([^%]*)%b([^%]*)' \
+        r'(?:%r(\d*)%z([^%]*)%s(\d*))?%?')
+_TEMPLATE = '%p{}%t{}%h{}%n{}%b{}%r{}%z{}%s{}'
+_INDEX = {tag: i for i, tag in enumerate(TAGS)}
+
+
+
+def parse(meta):
+    """Returns the config of a terminal from the 'function' field.
+    Missing or empty tags take the DEFAULT value. If a tag is
+    repeated, the first valid one is used.
+    @param meta: string with the tags. None is allowed.
+    @return: Metadata"""
+
+    if not meta:
+        return DEFAULT
+
+    m = _CANONICAL.fullmatch(meta)
+    if m:  # fast path: the whole string in one match
+        pos, typ, hose, conductor, bridge, reserve, positions, size = m.groups()
+        return Metadata(
+            int(pos) if pos else None,
+            typ or DEFAULT.terminal_type,
+            hose,
+            conductor,
+            bridge,
+            int(reserve) if reserve else DEFAULT.num_reserve,
+            positions or DEFAULT.reserve_positions,
+            int(size) if size else DEFAULT.size)
+
+    # tags in any order, unknown tags or text out of the tags
+    ret = list(DEFAULT)
+    found = set()
+    for token in meta.split(SEP)[1:]:
+        tag = token[:1]
+        if tag not in _INDEX or tag in found:
+            continue
+        value = token[1:]
+        if tag in NUMERIC_TAGS:
+            if not value.isdecimal():
+                continue
+            value = int(value)
+        found.add(tag)
+        if value != '':
+            ret[_INDEX[tag]] = value
+    return Metadata._make(ret)
+
+
+
+def serialize(metadata):
+    """Returns the string to save in the 'function' field.
+    The SEP is removed from the values because it can not be escaped.
+    parse(serialize(metadata)) == metadata for any valid Metadata.
+    @param metadata: Metadata
+    @return: string with all the tags"""
+
+    return _TEMPLATE.format(*[ \
+        '' if v is None else str(v).replace(SEP, '') for v in metadata])
+
+
+
+def from_dict(d, base=DEFAULT):
+    """Returns the Metadata of a terminal from a dict with, at least,
+    some of the fields of Metadata.
+    @param d: dict of a terminal
+    @param base: Metadata with the values of the missing fields
+    @return: Metadata"""
+
+    return Metadata._make(d.get(k, v) for k, v in zip(Metadata._fields, base))
@@ -21,17 +21,55 @@
 
 # Imports
 import logging as log
+import hashlib
 import operator
 import re
 import xml.etree.ElementTree as etree  # python3-lxml
-from collections import OrderedDict
+from collections import OrderedDict, namedtuple
 import tempfile
 import os
+import mmap
+import copy
+import shutil
+import time
+from collections import deque
+from contextlib import contextmanager
+from bisect import bisect_right
+
+from src import metadata
+from src.scancache import ScanCache
+from src.terminal import Terminal
+from src.xmltext import escape, quoteattr
+
+
+# Summary of a terminal block. first and last are the index of its first and
+# last terminal in QETProject.terminals.
+BlockSummary = namedtuple('BlockSummary', ['name', 'count', 'first', 'last', \
+        'has_hose', 'has_fuse', 'has_bridge'])
+
+# Element of a folio labeled like a terminal, with the data needed to make
+# its Terminal that does not depend on the rest of the project, so the
+# folios not changed are taken from the cache as is. row and column are
+# the xref in the folio.
+FolioTerminal = namedtuple('FolioTerminal', ['name', 'type', 'uuid', 'row', \
+        'column', 'metadata', 'cable'])
+
+# Result of the scan of a folio: attributes of the diagram and its
+# list of FolioTerminal.
+Folio = namedtuple('Folio', ['attrib', 'terminals'])
+
+
+
+class ProjectChanged(Exception):
+    """Raised when the project file has changed since its terminals were
+    read, so it must be read again"""
+
 
 
 class QETProject:
     """This class works with the XML source file of a QET Project.
-    The list of terminals has dicts like:
+    The list of terminals has Terminal records (see terminal.py) with
+    the fields:
         {uuid, block_name, terminal_name, terminal_pos, 
         terminal_xref, terminal_type, conductor_name, cable, cable_cond} 
     where:
@@ -53,12 +91,22 @@ class QETProject:
 
     # class attributes
     QET_COL_ROW_SIZE = 25  # pixels offset for elements coord
-    QET_BLOCK_TERMINAL_SIZE = 30  # pixels offset for elements coord
+    QET_BLOCK_TERMINAL_SIZE = metadata.DEFAULT_SIZE  # terminals per terminal block
+    LOGOS_START = b'<logos>'  # LOGO section, never parsed
+    LOGOS_END = b'</logos>'
+    LOGOS_EMPTY = b'<logos />'
+    READ_CHUNK = 1024 * 1024  # bytes fed to the parser at once
+    TERMINAL_LABEL = re.compile(r'^(.+):(.+)$')  # name of a terminal, i.e. X1:3
+    ELEMENT_START = re.compile(rb'<element\s')
+    ELEMENT_END = b'</element>'
+    DIAGRAM_START = re.compile(rb'<diagram[\s>]')
+    DIAGRAM_END = b'</diagram>'
 
 
 
     def __init__(self, project_file, fromPage='', \
-            toPage = '', searchImplicitsConnections = False):
+            toPage = '', searchImplicitsConnections = False, cache=None, \
+            progress=None):
         """class initializer. Parses the QET XML file.
         @param project_file: file of the QET project
         @param folio_reference_type: how to calc XRefs when recover project info:
@@ -66,7 +114,14 @@ class QETProject:
            'D' default (%f-%l%c) i.e. 15-F4
         @param fromPage: first page in range to be processed
         @param toPage: last page in range to be processed
-        @param searchImplicitsConnections: True for search implicit connections in TB creation"""
+        @param searchImplicitsConnections: True for search implicit connections in TB creation
+        @param cache: ScanCache. If the project has not changed since it
+            was cached, the terminals are read from it and the XML file is
+            only parsed when the project is edited or saved. If it has
+            changed, only the folios changed are parsed and scanned.
+        @param progress: function called as progress(done, total) every
+            time a folio is read. total is None if unknown. It can raise an
+            exception to stop the load, i.e. from other thread."""
 
         # Defines namespaces if exists. When changes the project logo in QET appears ns
         # but are not defined in the head, like:  xmlns:ns0="ns0".
@@ -90,27 +145,300 @@ class QETProject:
         #         with open(project_file, 'w' ,encoding='utf8') as f:
         #             f.write(xml)
         
-        # Creates a copy of original project because of the LOGO section usually has not defined namespaces
-        # and etree launches an error
-        regex_logos = '(<logos>[\s\S]+<\/logos>)'
-        with open(project_file, 'r' ,encoding='utf8') as f:
-            xml = f.read()
-            logo = re.findall( regex_logos, xml )  # namesapaces
-        if logo:
-            self.original_logo_section = logo
-            xml = re.sub(regex_logos, '<logos />', xml, 1)  #replaces first ocurrence
-        tmpf = tempfile.NamedTemporaryFile(mode='w', encoding='utf8', delete=False)
-        tmpf.write(xml)
-        log.info ("Generate temp file {}".format(tmpf.name))
-
         # starting...
-        self._qet_tree = etree.parse(tmpf.name)
         self.qet_project_file = project_file
-        self.qet_project = self._qet_tree.getroot()
-        
-        # determine xref format to use or default
-        self.folio_reference_type = self.qet_project.find('.//newdiagrams'). \
-                find('report').attrib['label']
+        self._elements = {}  # terminal elements by uuid
+        self._dirty = set()  # uuid of the terminals edited, pending to be saved
+        self._newTbs = []  # terminal blocks inserted, pending to be saved
+        self._tbXml = {}  # terminal blocks inserted already serialized, by node
+        self.timings = {}  # seconds spent in every phase of the load
+        self._loaded = False  # the XML is parsed
+
+        # content of the file the terminals come from, checked when saving
+        start = time.perf_counter()
+        self._fingerprint = fingerprint = ScanCache.fingerprint(project_file)
+        folios = None
+        if cache is not None:
+            data = cache.get(project_file, fingerprint)
+            self.timings['cache'] = time.perf_counter() - start
+            if data is not None:
+                log.info('Terminals of {} read from the cache'.format(project_file))
+                self.__used_terminals, self._blocks, self._folios = data
+                return
+            previous = cache.get_previous(project_file)  # folios of the last scan
+            folios = previous[2] if previous else {}
+
+        self._load(folios, progress)
+        if cache is not None:
+            cache.put(project_file, (self.__used_terminals, self._get_blocks(), \
+                    self._folios), fingerprint)
+
+
+
+    def _load(self, folios=None, progress=None):
+        """Parses the QET XML file and finds the terminals.
+        @param folios: Folio by digest of the diagram, from a previous scan.
+            The diagrams found here are not parsed, so the project can not
+            be edited until parsed in full. None to parse all and not to
+            compute the digests.
+        @param progress: function called after every folio. See __init__"""
+
+        start = time.perf_counter()
+        with self._openSource(self.qet_project_file) as source:
+            reused = self._parse(source, folios, progress)
+        self.timings['parse'] = time.perf_counter() - start
+
+        # general project info
+        self._totalPages = len (self._diagrams) + self.pageOffset
+
+        # elements type of terminal
+        self._terminalElements = self._getListOfElementsByType( 'terminal' )
+        self._terminalSuffixes = tuple(self._terminalElements)
+        self._terminalTypes = {}  # cache of _isTerminalType
+
+        # finds all terminals. A list of Terminal
+        start = time.perf_counter()
+        self._set_used_terminals()
+        self.timings['scan'] = time.perf_counter() - start
+        self._loaded = not reused
+
+
+    def _ensureLoaded(self, progress=None):
+        """Parses the XML file if the terminals, or some folios, were read
+        from the cache. Needed to edit or save the project. If the file
+        has changed since the terminals were read, save_tb refuses it.
+        @param progress: function called after every folio. See __init__"""
+
+        if self._loaded:
+            return
+        log.info('Parsing {} to edit it'.format(self.qet_project_file))
+        self._load(None, progress)
+
+
+    def ensure_loaded(self, progress=None):
+        """Parses the project now if it is needed to edit it, instead of
+        in the first change, i.e. to report its progress.
+        @param progress: function called after every folio. See __init__"""
+
+        self._ensureLoaded(progress)
+
+
+    def discard_changes(self):
+        """Forgets the changes not saved yet: the terminal blocks inserted
+        and the terminals updated. The project is parsed again from its
+        file on the next change."""
+
+        self._dirty = set()
+        self._newTbs = []
+        self._tbXml = {}
+        self._elements = {}
+        self._loaded = False
+
+
+
+    @contextmanager
+    def _openSource(self, project_file):
+        """Maps the QET project file in memory. The file is read by the OS
+        on demand, so it is never copied in full to the python heap.
+        @param project_file: file of the QET project
+        @return: read only mmap object"""
+
+        with open(project_file, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                yield source
+
+
+    def _getLogosSpan(self, source):
+        """Returns the position of the LOGO section in the source.
+        The LOGO section usually has not defined namespaces and etree
+        launches an error, so it is never parsed. It is kept as an opaque
+        span of bytes, from the first <logos> to the last </logos>.
+        @param source: mmap of the QET project
+        @return: (start, end) or None if not exists"""
+
+        start = source.find(QETProject.LOGOS_START)
+        if start == -1:
+            return None
+        end = source.rfind(QETProject.LOGOS_END)
+        if end <= start + len(QETProject.LOGOS_START):
+            return None
+        return (start, end + len(QETProject.LOGOS_END))
+
+
+    def _getDiagramSpans(self, source):
+        """Returns the position of every <diagram> in the source, from its
+        start tag to the end of its end tag, found without parsing.
+        @param source: mmap of the QET project
+        @return: [(start, end)] in document order, or None if some diagram
+            has no end"""
+
+        logos = self._getLogosSpan(source)
+        ret = []
+        pos = 0
+        while True:
+            match = QETProject.DIAGRAM_START.search(source, pos)
+            if match is None:
+                return ret
+            start = match.start()
+            if logos and logos[0] <= start < logos[1]:
+                pos = logos[1]
+                continue
+            end = source.find(QETProject.DIAGRAM_END, start)
+            if end == -1:
+                return None
+            pos = end + len(QETProject.DIAGRAM_END)
+            ret.append( (start, pos) )
+
+
+    def _iterSource(self, source, skip=()):
+        """Parses the source as a stream, replacing the LOGO section by an
+        empty <logos /> node.
+        @param source: mmap of the QET project
+        @param skip: spans of the source not fed to the parser, sorted
+        @return: iterator of (event, node) for 'start' and 'end' events"""
+
+        cuts = [(start, end, b'') for start, end in skip]  # (start, end, replacement)
+        logos = self._getLogosSpan(source)
+        if logos:
+            cuts.append( (logos[0], logos[1], QETProject.LOGOS_EMPTY) )
+            cuts.sort()
+        spans = []
+        pos = 0
+        for start, end, replacement in cuts:
+            spans.append( (pos, start) )
+            if replacement:
+                spans.append(replacement)
+            pos = end
+        spans.append( (pos, len(source)) )
+
+        parser = etree.XMLPullParser(events=('start', 'end'))
+        for span in spans:
+            if isinstance(span, bytes):
+                parser.feed(span)
+                continue
+            for i in range(span[0], span[1], QETProject.READ_CHUNK):
+                parser.feed(source[i:min(i + QETProject.READ_CHUNK, span[1])])
+                yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+
+    def _parse(self, source, folios=None, progress=None):
+        """Reads the QET XML file in a single streaming pass.
+
+        Only the needed info is kept: the project node with its
+        <collection>, the xref format from <newdiagrams> and, for every
+        <diagram>, its attributes and the elements labeled like a terminal
+        (see FolioTerminal). Every folio is cleared once processed, so the
+        memory used is bounded by the largest folio.
+
+        If 'folios' is given, the bytes of every diagram are hashed first.
+        The diagrams with a digest in 'folios' are not fed to the parser and
+        its Folio is used instead, so only the folios changed are parsed.
+        @param source: mmap of the QET project
+        @param folios: Folio by digest of the diagram, or None
+        @param progress: function called after every folio. See __init__
+        @return: num of folios taken from 'folios'"""
+
+        self._diagrams = []  # [(diagram attributes node, [FolioTerminal])]
+        self._folios = None if folios is None else {}  # Folio by digest, to cache
+        self._conductorIndex = {}  # cable number of every terminal id, per diagram
+        self._grid = {}  # geometry and folio, per diagram
+        self._xrefTemplates = {}  # xref format, per diagram
+        self.folio_reference_type = None
+
+        # position in the source of the nodes that can be edited
+        self._spans = {}  # span of the terminal elements, by uuid
+        self._tbSpans = {}  # span of the terminal blocks in the collection, by node
+        self._tbInsertAt = None  # position of the new terminal blocks
+        self._sourceTbs = []  # terminal blocks in the source
+        cursor = 0  # the source before is already located
+
+        plan = deque()  # (digest, Folio or None to parse, span) of every diagram
+        spans = None
+        if folios is not None or progress is not None:
+            spans = self._getDiagramSpans(source)
+        if folios is not None:
+            with memoryview(source) as view:
+                for start, end in spans or []:
+                    digest = hashlib.sha1(view[start:end]).hexdigest()
+                    plan.append( (digest, folios.get(digest), (start, end)) )
+        self._progress = progress  # called after every folio
+        self._numFolios = None if spans is None else len(spans)  # to report
+        skip = [span for digest, folio, span in plan if folio is not None]
+        parsed = len(plan) - len(skip)  # diagrams expected by the parser
+
+        depth = 0
+        for event, node in self._iterSource(source, skip):
+            if event == 'start':
+                if depth == 0:
+                    self.qet_project = node
+                    self._readProjectAttributes()
+                depth += 1
+                continue
+
+            depth -= 1
+            if node.tag == 'newdiagrams' and self.folio_reference_type is None:
+                # determine xref format to use or default
+                self.folio_reference_type = node.find('report').attrib['label']
+
+            if depth == 1:  # childs of the project
+                if node.tag == 'diagram':
+                    parsed -= 1
+                    elements = self._scanDiagram(node, self._reuseFolios(plan))
+                    cursor = self._locateElements(source, elements, cursor)
+                elif node.tag == 'collection':
+                    self._locateTerminalBlocks(source, node, cursor)
+                if node.tag != 'collection':
+                    self.qet_project.remove(node)
+                    node.clear()
+        self._reuseFolios(plan)
+
+        if parsed:  # the diagrams found are not the ones parsed
+            self._folios = None
+            if skip:
+                log.warning('Cannot locate the folios of {}. Parsing all of them' \
+                        .format(self.qet_project_file))
+                return self._parse(source, {}, progress)
+        if skip:
+            log.info('{} of {} folios taken from the cache'.format(len(skip), \
+                    len(self._diagrams)))
+        return len(skip)
+
+
+    def _reuseFolios(self, plan):
+        """Adds the folios taken from the cache, in order, until the next
+        diagram to parse.
+        @param plan: deque of (digest, Folio or None, span), consumed
+        @return: digest of the next diagram to parse, or None"""
+
+        while plan:
+            digest, folio, span = plan.popleft()
+            if folio is None:
+                return digest
+            self._addFolio(folio, digest)
+        return None
+
+
+    def _addFolio(self, folio, digest=None, page=None):
+        """Adds the scan of a folio to the project.
+        @param folio: Folio
+        @param digest: of the diagram, to cache the folio
+        @param page: diagram attributes node, if already created"""
+
+        if page is None:
+            page = etree.Element('diagram', folio.attrib)
+            self._grid[page] = self._getGrid(page)
+        self._diagrams.append( (page, folio.terminals) )
+        if digest is not None and self._folios is not None:
+            self._folios[digest] = folio
+        if self._progress is not None:
+            self._progress(len(self._diagrams), self._numFolios)
+
+
+    def _readProjectAttributes(self):
+        """Reads the general project info from the attributes of the
+        project node. Needed before visiting the diagrams."""
 
         # XML version
         self.xml_version = self.qet_project.attrib['version']
@@ -123,22 +451,125 @@ class QETProject:
         else:
             log.info ("Atribute 'folioSheetQuantity' doesn't exist. Assuming 0")
             self.pageOffset = 0
-            
 
-        # general project info
-        self._totalPages = len (self.qet_project.findall('.//diagram')) + \
-                self.pageOffset
 
-        # elements type of terminal
-        self._terminalElements = self._getListOfElementsByType( 'terminal' )
-
-        # finds all terminals. A list of dicts
-        self._set_used_terminals()
-
-        #deleting temp file
-        tmpf.close()
-        os.unlink(tmpf.name)
-        log.info ("Deleted temp file {}".format(tmpf.name))
+    def _scanDiagram(self, diagram, digest=None):
+        """Extracts from a diagram(page) the data needed to find the terminals.
+        @param diagram: diagram(page) XML etree object
+        @param digest: of the diagram in the source, to cache its Folio
+        @return: [(name, element)] elements labeled like a terminal"""
+
+        page = etree.Element('diagram', dict(diagram.attrib))
+        self._conductorIndex[page] = self._getConductorIndex(diagram)
+        self._grid[page] = self._getGrid(page)
+
+        elements = []  # [(name, element)]
+        terminals = []  # [FolioTerminal]
+        for element in diagram.iter('element'):
+            name = self._getElementName(element).strip()
+            if QETProject.TERMINAL_LABEL.search(name):
+                elements.append( (name, element) )
+                terminal = self._getFolioTerminal(page, name, element)
+                if terminal.uuid is not None:
+                    self._elements[terminal.uuid] = element
+                    terminals.append(terminal)
+        del self._conductorIndex[page]  # the cables are known now
+        self._addFolio(Folio(dict(diagram.attrib), terminals), digest, page)
+        return elements
+
+
+    def _getFolioTerminal(self, diagram, name, element):
+        """Returns the data of an element labeled like a terminal.
+        @param diagram: diagram(page) attributes node
+        @param name: name of the element
+        @param element: element XML etree object
+        @return: FolioTerminal"""
+
+        cable = ''  # of the first terminal connected
+        terminals = element.find('terminals')
+        if terminals is not None:
+            for terminal in terminals.findall('terminal')[:2]:
+                cable = self._getCableNum(diagram, terminal.get('id'))
+                if cable:
+                    break
+
+        try:
+            row, column = self._getXRefByCoord(diagram, \
+                    int(float(element.get('x', 0))), int(float(element.get('y', 0))))
+        except (IndexError, ValueError):  # out of the grid
+            log.warning('Element {} out of the grid of page {}'.format( \
+                    name, diagram.get('title')))
+            row = column = ''
+        return FolioTerminal(name, element.get('type'), element.get('uuid'), \
+                row, column, self._getElementMetadata(element), cable)
+
+
+    def _locateElements(self, source, elements, cursor):
+        """Finds in the source the span of every element, from its start tag
+        to its end tag, searching forward from 'cursor'. Elements must be
+        in document order. The elements not found are skipped.
+        @param source: mmap of the QET project
+        @param elements: [(name, element)]
+        @param cursor: position to start searching
+        @return: position after the last element found"""
+
+        for name, element in elements:
+            uuid = element.get('uuid')
+            if uuid is None:
+                continue
+            key = 'uuid={}'.format(quoteattr(uuid)).encode('utf8')
+            pos = source.find(key, cursor)
+            while pos != -1:
+                start = source.rfind(b'<', cursor, pos)
+                if QETProject.ELEMENT_START.match(source[start:start + 9]) and \
+                        source[pos - 1:pos].isspace():  # uuid of the element
+                    end = source.find(QETProject.ELEMENT_END, pos)
+                    if end != -1:
+                        cursor = end + len(QETProject.ELEMENT_END)
+                        self._spans[uuid] = (start, cursor)
+                    break
+                pos = source.find(key, pos + 1)
+        return cursor
+
+
+    def _locateTerminalBlocks(self, source, collection, cursor):
+        """Finds in the source where the terminal blocks are inserted, the
+        start of the first category of the collection, and the span of the
+        terminal blocks already there, including its tail.
+        @param source: mmap of the QET project
+        @param collection: collection XML etree object
+        @param cursor: position to start searching"""
+
+        category = collection.find('category')
+        start = source.find(b'<collection', cursor)
+        if category is None or start == -1:
+            return
+        self._sourceTbs = self._getTerminalBlocks(category)
+        start = source.find(b'<category', start)
+        end = source.find(b'>', start)
+        if start == -1 or end == -1 or source[end - 1:end] == b'/':
+            return
+        self._tbInsertAt = source.find(b'<', end)  # after the category text
+        cursor = self._tbInsertAt
+
+        for element in self._sourceTbs:
+            name = element.get('name')
+            key = '<element name={}'.format(quoteattr(name)).encode('utf8')
+            start = source.find(key, cursor)
+            end = source.find(QETProject.ELEMENT_END, start)
+            if start == -1 or end == -1:
+                continue
+            cursor = end + len(QETProject.ELEMENT_END)
+            self._tbSpans[element] = (start, source.find(b'<', cursor))
+
+
+    def _getTerminalBlocks(self, category):
+        """Returns the terminal blocks of a category of the collection.
+        @param category: category XML etree object
+        @return: list of element XML etree objects"""
+
+        return [ x for x in category.findall('element') \
+                if x.get('name', '').startswith('TB_') ]
 
 
 
@@ -194,66 +625,54 @@ class QETProject:
     def _getElementMetadata (self, element):
         """Returns the metadata of the terminal element.
         All the info is Function field under 'elementInformation'
-        return: {} with the content of every key"""
+        return: Metadata with the content of every key"""
 
         meta = ''
-        ret = {}
     
         ## Get meta string
-        for t in element.find('elementInformations').findall('elementInformation'):
-            if t.attrib['name'] == 'function':
-                meta = t.text
-                break
+        elinfos = element.find('elementInformations')
+        if elinfos is not None:
+            for t in elinfos.findall('elementInformation'):
+                if t.attrib['name'] == 'function':
+                    meta = t.text
+                    break
         
-        ## Getting data
-        if meta is None:
-            meta = ''
-        foo  = re.search(r'%p(\d+)(%|$)', meta)  # %p
-        ret['terminal_pos'] = foo.group(1) if foo else ''
-
-        foo = re.search(r'%t([^%]*)(%|$)', meta)  # %t
-        tp = ''
-        if foo: tp = foo.group(1)
-        ret['terminal_type'] = foo.group(1) if tp!='' else 'STANDARD'
-    
-        foo  = re.search(r'%h([^%]*)(%|$)', meta)  # %h. Conductor of a hose
-        ret['hose'] = foo.group(1) if foo else ''
+        return metadata.parse(meta)
 
-        foo  = re.search(r'%n([^%]*)(%|$)', meta)  # %n . Cable Hose
-        ret['conductor'] = foo.group(1) if foo else ''
-                
-        foo  = re.search(r'%b([^%]*)(%|$)', meta)  # %b
-        ret['bridge'] = foo.group(1) if foo else ''
 
-        foo = re.search(r'%r(\d+)(%|$)', meta)  # %r
-        tp = ''
-        if foo: tp = foo.group(1)
-        ret['num_reserve'] = foo.group(1) if tp != '' else 0
+    def _isTerminalType (self, element_type):
+        """ Checks if the 'type' attribute of an element refers to one of
+        the terminal elements of the collection, i.e. ends with its name.
+        Every different type is checked only once per project, so the
+        check is a dict lookup no matter how many terminal definitions
+        exist in the collection.
+        @param element_type: 'type' attribute of an element
+        @return: True / False"""
 
-        foo = re.search(r'%z([^%]*)(%|$)', meta)  # %z
-        ret['reserve_positions'] = foo.group(1) if foo else ''
+        try:
+            return self._terminalTypes[element_type]
+        except KeyError:
+            ret = element_type.endswith(self._terminalSuffixes)
+            self._terminalTypes[element_type] = ret
+            return ret
 
-        foo = re.search(r'%s(\d+)(%|$)', meta)  # %s (terminals per terminal block)
-        tp = ''
-        if foo: tp = foo.group(1)
-        ret['size'] = foo.group(1) if tp != '' else QETProject.QET_BLOCK_TERMINAL_SIZE
-
-        return ret
 
+    def _getConductorIndex(self, diagram):
+        """Return a dict with the cable number connected at every terminal
+        of the page 'diagram'. Walks the conductors of the page only once.
+        If several conductors reach the same terminal, the last one wins.
+        @param diagram: diagram(page) XML etree object
+        @return: {terminalId: cable number}"""
 
-    def _isValidTerminal (self, element):
-        """ An element is valid if type is 'terminal' and label is like 'X1:1'
-        @param element:  element  (XML etree object)
-        @return: True / False"""
-        
-        tmp = self._getElementName(element).strip()  #kk 
-        if re.search(r'^(.+):(.+)$', self._getElementName(element).strip()):
-            if 'type' in element.attrib:  # elements must have a 'type'
-                for el in self._terminalElements:  # searching type
-                    if re.search(el + '$', element.attrib['type']):
-                        return True
-        
-        return False
+        ret = {}
+        conductors = diagram.find('conductors')
+        if conductors is None:
+            return ret
+        for cable in conductors.findall('conductor'):
+            for k, v in cable.attrib.items():
+                if k[:8] == 'terminal':
+                    ret[v] = cable.attrib['num']
+        return ret
 
 
     def _getCableNum(self, diagram, terminalId):
@@ -262,59 +681,52 @@ class QETProject:
         @param terminalId: text with the terminal Id
         @return: string whith cable  number"""
 
-        ret = ''
         log.debug ("Getting cable number connected to terminal {} at page {}".format ( \
             terminalId, diagram.attrib['title']))
-        for cable in diagram.find('conductors').findall('conductor'):
-            for cable_terminal in \
-                    [x for x in cable.attrib if x[:8] == 'terminal' ]:
-                if cable.attrib[cable_terminal] == terminalId:
-                    ret = cable.attrib['num']
-        return ret
+        return self._conductorIndex[diagram].get(terminalId, '')
 
     
-    def _getXRef(self, diagram, element, offset_x = 0, offset_y = 0):
-        """Return a string with the xreference.
+    def _formatXRef(self, diagram, row, col):
+        """Return the xreference of a row and column of the page 'diagram'
+        @param diagram: diagram(page) XML etree object
+        @param row, col: as returned by _getXRefByCoord
+        @return: string like "p-rc" (page - rowLetter colNumber)"""
+
+        # Change tags to real value
+        ret = self._getXRefTemplate(diagram)
+        if '%l' in ret:
+            ret = ret.replace('%l', row)
+        if '%c' in ret:
+            ret = ret.replace('%c', col)
+
+        return ret
 
-        The element is specified by 'element' at page 'diagam'.
-        The page number incremented in one if there are a "index" page
+
+    def _getXRefTemplate(self, diagram):
+        """Return the xreference format of the page 'diagram' with all the
+        tags replaced except the row (%l) and column (%c) ones.
+        Calculated once per page.
 
         @param diagram: diagram(page) XML etree object
-        @param element: element XML etree object
-        @param offset_x: correction of the coord x.
-               Useful for Xref for the terminal of an element
-        @param offset_y: correction of the coord y
-        @return: string like "p-rc" (page - rowLetter colNumber)"""
-        ret = self.folio_reference_type
+        @return: string like "p-%l%c" """
 
-        # get coord
-        element_x = int(float(element.attrib['x'])) + int(float(offset_x))
-        element_y = int(float(element.attrib['y'])) + int(float(offset_y))
-        row, col = self._getXRefByCoord (diagram, element_x, element_y)
-        diagram_page = str(int(diagram.attrib['order']) + self.pageOffset)
+        if diagram in self._xrefTemplates:
+            return self._xrefTemplates[diagram]
 
-        # Change tags to real value
+        ret = self.folio_reference_type
+        diagram_page, folio_label = self._grid[diagram][3:]
         if '%f' in ret:
             ret = ret.replace('%f', diagram_page)
         if '%F' in ret:
-            # %F could include extra tags
-            folio_label = diagram.attrib['folio']
-            if '%id' in folio_label:
-                folio_label = folio_label.replace('%id', diagram_page)
             if '%total' in folio_label:
                 folio_label = folio_label.replace('%total', str(self._totalPages))
-            if '%autonum' in folio_label:
-                folio_label = folio_label.replace('%autonum', diagram_page)
             ret = ret.replace('%F', folio_label)
         if '%M' in ret:
             ret = ret.replace('%M', self._getDiagramAttribute(diagram,'machine'))
         if '%LM' in ret:
             ret = ret.replace('%LM', self._getDiagramAttribute(diagram, 'locmach'))
-        if '%l' in ret:
-            ret = ret.replace('%l', row)
-        if '%c' in ret:
-            ret = ret.replace('%c', col)
 
+        self._xrefTemplates[diagram] = ret
         return ret
 
 
@@ -331,6 +743,31 @@ class QETProject:
             return ''
 
 
+    def _getGrid(self, diagram):
+        """Return the geometry and the folio of the page 'diagram'.
+        Calculated when the page is visited.
+
+        @param diagram: diagram(page) XML etree object
+        @return: (col_size, row_size, rows_letters, diagram_page, folio_label)
+            where the folio label has the %id and %autonum tags replaced,
+            but not %total, unknown until all the pages are visited."""
+
+        col_size = int(diagram.attrib['colsize'])
+        rows = int(diagram.attrib['rows'])
+        row_size = int(diagram.attrib['rowsize'])
+        rows_letters = [chr(x + 65) for x in range(rows)]
+        diagram_page = str(int(diagram.attrib['order']) + self.pageOffset)
+
+        # %F could include extra tags
+        folio_label = diagram.attrib.get('folio', '')
+        if '%id' in folio_label:
+            folio_label = folio_label.replace('%id', diagram_page)
+        if '%autonum' in folio_label:
+            folio_label = folio_label.replace('%autonum', diagram_page)
+
+        return (col_size, row_size, rows_letters, diagram_page, folio_label)
+
+
     def _getXRefByCoord(self, diagram, x, y):
         """Return a string with the xreference for the coordinates at page 'diagam'
         The page number incremented in one if there are a "index" page
@@ -340,16 +777,12 @@ class QETProject:
         @return: string like "p-rc" (page - rowLetter colNumber)"""
 
         # get requiered data
-        cols = int(diagram.attrib['cols'])
-        col_size = int(diagram.attrib['colsize'])
-        rows = int(diagram.attrib['rows'])
-        row_size = int(diagram.attrib['rowsize'])
+        col_size, row_size, rows_letters = self._grid[diagram][:3]
         element_x = int(x)
         element_y = int(y)
-        rows_letters = [chr(x + 65) for x in range(rows)]
 
-        log.debug( 'Cols: {}\tCol size: {}\tRow size: {}\tX position: {}\tY Position: {}'. \
-                format (cols, col_size, row_size, element_x, element_y))
+        log.debug( 'Col size: %s\tRow size: %s\tX position: %s\tY Position: %s', \
+                col_size, row_size, element_x, element_y)
 
         row_letter = rows_letters[ int(
                 (element_y - QETProject.QET_COL_ROW_SIZE) / row_size) - 1 + 1]
@@ -366,122 +799,407 @@ class QETProject:
 
     def _set_used_terminals(self):
         """Creates a list of all terminal elements used in the qet project.
-        List where every element is a dict. See class info.
+        List where every element is a Terminal. See class info.
         Sorted by Block_name and terminal_pos
         """
 
         ret = []
 
         # first search for elements of type 'terminal' and its conductors.
-        for diagram in self.qet_project.findall('diagram'):  # all diagrams
-            for element in diagram.findall('.//element'):  # all elements in diagram
-                el = {}
-
-                if self._isValidTerminal(element):
+        for diagram, terminals in self._diagrams:  # all diagrams
+            for t in terminals:  # elements labeled like a terminal
+                if t.type is not None and self._isTerminalType(t.type):
 
-                    terminalName = self._getElementName(element).strip()
-                    meta_data = self._getElementMetadata (element)
-                    
-                    terminals = element.find('terminals').findall( 'terminal' )
-                    terminalId = terminals[0].attrib['id']
-                    cableNum = self._getCableNum(diagram, terminalId)
-                    terminalId2 = terminals[1].attrib['id']
-                    cableNum2 = self._getCableNum(diagram, terminalId2)
-                    if cableNum == '': cableNum = cableNum2
+                    meta_data = t.metadata
                     
-                    el['uuid'] = element.attrib['uuid']
-                    el['block_name'] = terminalName.split(':')[0]
-                    el['terminal_name'] = terminalName.split(':')[1]
-                    el['terminal_xref'] = self._getXRef(diagram, element)
-                    el['cable'] = cableNum             
-                    if meta_data['terminal_pos']=='':  #  convert to integer for more initial intelligent sorting
+                    el = Terminal(uuid=t.uuid, **meta_data._asdict())
+                    el.block_name = t.name.split(':')[0]
+                    el.terminal_name = t.name.split(':')[1]
+                    el.terminal_xref = self._formatXRef(diagram, t.row, t.column)
+                    el.cable = t.cable
+                    if meta_data.terminal_pos is None:  #  convert to integer for more initial intelligent sorting
                         try:
-                            el['terminal_pos'] = int(el['terminal_name']) 
+                            el.terminal_pos = int(el.terminal_name) 
                         except:
-                            el['terminal_pos'] = 1
-                    else:
-                        el['terminal_pos'] = int(meta_data['terminal_pos'])
-                    el['terminal_type'] = meta_data['terminal_type']
-                    el['hose'] = meta_data['hose']
-                    el['conductor'] = meta_data['conductor']
-                    el['bridge'] = meta_data['bridge']
-                    el['num_reserve'] = meta_data['num_reserve']
-                    el['reserve_positions'] = meta_data['reserve_positions']
-                    el['size'] = meta_data['size']
-                if el: ret.append(el)
+                            el.terminal_pos = 1
+                    ret.append(el)
         
         # SQL = ORDER BY block_name DESC, terminal_pos ASC
-        ret.sort(key=operator.itemgetter('terminal_pos'))
-        ret.sort(key=operator.itemgetter('block_name'), reverse=True)
+        ret.sort(key=operator.attrgetter('terminal_pos'))
+        ret.sort(key=operator.attrgetter('block_name'), reverse=True)
 
         #Renum. position field from 1 by one-to-one
         memo_tb = ''; i = 1
         for t in ret:
-            if t['block_name'] != memo_tb:
+            if t.block_name != memo_tb:
                 i=1
-            t['terminal_pos'] = i
-            memo_tb = t['block_name']
+            t.terminal_pos = i
+            memo_tb = t.block_name
             i +=1
 
         self.__used_terminals = ret
+        self._blocks = None  # summary of the terminal blocks, on demand
+
+
+    def _get_blocks(self):
+        """Returns the summary of every terminal block, computed once
+        for the current list of terminals.
+        @return: OrderedDict of BlockSummary by name, in the order
+            of the terminals"""
+
+        if self._blocks is not None:
+            return self._blocks
+
+        data = OrderedDict()  # [name, count, first, last, flags...] by name
+        for i, t in enumerate(self.__used_terminals):
+            b = data.get(t.block_name)
+            if b is None:
+                b = data[t.block_name] = [t.block_name, 0, i, i, False, False, False]
+            b[1] += 1
+            b[3] = i
+            if t.hose: b[4] = True
+            if t.terminal_type == 'FUSE': b[5] = True
+            if t.bridge: b[6] = True
+        self._blocks = OrderedDict( (k, BlockSummary._make(v)) for k, v in data.items() )
+        return self._blocks
 
 
     def get_max_tb_length(self):
         """
         Returns the lenth of terminal-block with more terminals
         """
-        t = [ x['block_name'] for x in self.__used_terminals]
-        ocurrences = [t.count(i) for i in t]
-        return max(ocurrences)
+        return max([b.count for b in self._get_blocks().values()], default=0)
 
     def update_terminals(self, data):
         """Changes the config of every terminal in the diagra. The changes made 
         in the plugin will be save in the 'elementInformation' of every
-        terminal."""
-        for diagram in self.qet_project.findall('diagram'):  # all diagrams(pages)
-            for element in diagram.iter('element'):  # all elements in diagram
-                dt = [x for x in data if x['uuid'] == element.attrib['uuid']]
-                if dt:
-                    found = False
-                    # value = r'%p{}%t{}%h{}%n{}%b{}%r{}%z{}%s{}'.format(
-                    #         dt[0]['terminal_pos'], \
-                    #         dt[0]['terminal_type'], \
-                    #         dt[0]['hose'], \
-                    #         dt[0]['conductor'], \
-                    #         dt[0]['bridge'], \
-                    #         dt[0]['num_reserve'], \
-                    #         dt[0]['reserve_positions'], \
-                    #         dt[0]['size'] )
-                    value = r'%p{}%t{}%h{}%n{}%b{}%'.format(
-                            dt[0]['terminal_pos'], \
-                            dt[0]['terminal_type'], \
-                            dt[0]['hose'], \
-                            dt[0]['conductor'], \
-                            dt[0]['bridge'] )
-                    for elinfo in element.iter('elementInformation'):
-                        if elinfo.attrib['name'] == 'function':
-                            elinfo.text = value
-                            found = True
-                    if not found:  # crete a new child
-                        #~ print ('----------------------- {}'.format(element.attrib['uuid']))
-                        father = element.find('elementInformations')
-                        new = etree.SubElement(father, \
-                                'elementInformation',
-                                name="function", \
-                                show="0")
-                        new.text = value
-
-
-    def save_tb(self, filename):
-        self._qet_tree.write(filename)  #, pretty_print=True)
-
-        # replace temporal empty logo with the original
-        if self.original_logo_section:
-            with open(filename, 'r' ,encoding='utf8') as f:
-                xml = f.read()
-            new_xml = re.sub('<logos />', self.original_logo_section[0], xml, 1)  #replaces first ocurrence
-            with open(filename, 'w' ,encoding='utf8') as f:
-                f.write(new_xml)
+        terminal when the project is saved.
+        Only the terminals in 'data' are touched, found by its uuid."""
+        self._ensureLoaded()
+        updates = {}
+        for t in data:
+            updates.setdefault(t['uuid'], t)
+        for uuid, t in updates.items():
+            element = self._elements.get(uuid)
+            if element is not None:
+                self._updateTerminal(element, t)
+                self._dirty.add(uuid)
+
+
+    def _updateTerminal(self, element, data):
+        """Saves the config of a terminal in its 'elementInformation'.
+        The fields missing in 'data' keep the value saved in the terminal.
+        @param element: element XML etree object
+        @param data: dict with the terminal config"""
+        functions = [ x for x in element.iter('elementInformation') \
+                if x.attrib['name'] == 'function' ]
+        current = metadata.parse(functions[0].text if functions else '')
+        value = metadata.serialize(metadata.from_dict(data, current))
+        for elinfo in functions:
+            elinfo.text = value
+        if not functions:  # crete a new child
+            father = element.find('elementInformations')
+            new = etree.SubElement(father, \
+                    'elementInformation',
+                    name="function", \
+                    show="0")
+            new.text = value
+
+
+    def save_tb(self, filename, backup=None, incremental=True):
+        """Saves the project to 'filename'.
+
+        In incremental mode only the edited terminal elements and the terminal
+        blocks inserted or removed are serialized. They are spliced into the
+        bytes of the source project, that are copied as is. If the position
+        of some change is unknown, the full mode is used.
+
+        In full mode the source project is read again as a stream and copied
+        folio by folio, swapping the edited terminal elements and replacing
+        the <collection> with the one in memory. The LOGO section is copied
+        back as is from the source.
+
+        The project is written to a temp file in the same folder and then
+        renamed, so 'filename' can be the source project itself. A new
+        file gets the mode of the umask, an existing one keeps its mode.
+        If 'filename' is a symlink, the file it points to is replaced.
+        @param filename: destination file
+        @param backup: if specified, the current 'filename' is renamed to it
+            instead of being replaced.
+        @param incremental: False to force the full mode
+        @raise ProjectChanged: if the source project is not the file the
+            terminals were read from, i.e. QET saved it again meanwhile.
+            Nothing is written: the positions of the changes, and the
+            changes themselves, are from the old content."""
+
+        self._ensureLoaded()
+        target = os.path.realpath(filename)  # through the symlinks
+        folder = os.path.dirname(target)
+        with tempfile.NamedTemporaryFile(dir=folder, prefix='.qet_tb_', \
+                suffix='.qet', delete=False) as f:
+            try:
+                with self._openSource(self.qet_project_file) as source:
+                    self._checkSource(source)
+                    edits = self._getEdits() if incremental else None
+                    if edits is None:
+                        log.info("Saving the full project to {}".format(filename))
+                        self._write(source, f)
+                    else:
+                        log.info("Saving {} changes to {}".format(len(edits), filename))
+                        self._writeEdits(source, edits, f)
+            except:
+                f.close()
+                os.unlink(f.name)
+                raise
+        if os.path.isfile(target):
+            shutil.copymode(target, f.name)
+            overwrite = os.path.samefile(target, self.qet_project_file)
+            if backup and os.path.islink(filename):
+                shutil.copy2(target, backup)  # the symlink stays
+            elif backup:
+                os.replace(target, backup)
+        else:
+            os.chmod(f.name, 0o666 & ~self._getUmask())  # not the 0600 of the temp
+            overwrite = False
+        os.replace(f.name, target)
+
+        if overwrite:  # the source has changed
+            self.qet_project_file = filename
+            self._fingerprint = ScanCache.fingerprint(filename)
+            self._rebase(edits)
+
+
+    @staticmethod
+    def _getUmask():
+        """Returns the umask of the process. It can only be read by
+        setting it, so it is set back at once."""
+
+        umask = os.umask(0o022)
+        os.umask(umask)
+        return umask
+
+
+    def _checkSource(self, source):
+        """Checks that the source project is the file the terminals, and
+        the position of its elements, were read from.
+        @param source: mmap of the QET project
+        @raise ProjectChanged: if it has changed since"""
+
+        if len(source) != self._fingerprint.size or \
+                hashlib.sha1(source).hexdigest() != self._fingerprint.hash:
+            raise ProjectChanged('{} has changed since it was opened'.format( \
+                    self.qet_project_file))
+
+
+    def _getEdits(self):
+        """Returns the changes to splice into the source project.
+        @return: list of (start, end, bytes, node), sorted, where node is the
+            edited element or a list of (terminal block, size) inserted.
+            None if the position of some change is unknown."""
+
+        edits = []
+        for uuid in self._dirty:
+            if uuid not in self._spans:
+                return None
+            start, end = self._spans[uuid]
+            element = self._elements[uuid]
+            edits.append( (start, end, self._serialize(element), element) )
+
+        category = self.qet_project.find('collection').find('category')
+        current = set(category)
+        for element in self._sourceTbs:
+            if element not in current:  # removed by insert_tb
+                if element not in self._tbSpans:
+                    return None
+                start, end = self._tbSpans[element]
+                edits.append( (start, end, b'', element) )
+
+        new = set(self._newTbs)
+        new = [x for x in category if x in new]
+        if new:
+            if self._tbInsertAt is None:
+                return None
+            at = self._tbInsertAt
+            xmls = [self._getTbXml(x) for x in new]
+            edits.append( (at, at, b''.join(xmls), list(zip(new, map(len, xmls)))) )
+
+        edits.sort(key=lambda x: x[:2])
+        return edits
+
+
+    def _serialize(self, node):
+        """Returns a node serialized, without its tail"""
+
+        tail, node.tail = node.tail, None
+        try:
+            return etree.tostring(node)
+        finally:
+            node.tail = tail
+
+
+    def _getTbXml(self, tb):
+        """Returns a terminal block serialized, without its tail"""
+
+        if tb in self._tbXml:
+            return self._tbXml[tb]
+        return self._serialize(tb)
+
+
+    def _getCollection(self):
+        """Returns the <collection> to write. The terminal blocks inserted
+        already serialized are parsed in a copy, so the tree of the project
+        keeps the placeholders.
+        @return: collection XML etree object"""
+
+        collection = self.qet_project.find('collection')
+        if not self._tbXml:
+            return collection
+
+        collection = copy.copy(collection)  # childs are shared
+        for i, category in enumerate(collection):
+            if category.tag != 'category':
+                continue
+            collection[i] = category = copy.copy(category)
+            for j, element in enumerate(category):
+                if element in self._tbXml:
+                    tb = etree.fromstring(self._tbXml[element])
+                    tb.tail = element.tail
+                    category[j] = tb
+            break
+        return collection
+
+
+    def _writeEdits(self, source, edits, f):
+        """Copies 'source' to the opened file 'f' splicing the edits.
+        @param source: mmap of the QET project
+        @param edits: list returned by _getEdits
+        @param f: binary file to write"""
+
+        pos = 0
+        for start, end, xml, node in edits:
+            self._copy(source, pos, start, f)
+            f.write(xml)
+            pos = end
+        self._copy(source, pos, len(source), f)
+
+
+    def _copy(self, source, start, end, f):
+        """Copies source[start:end] to the opened file 'f' by chunks"""
+
+        for i in range(start, end, QETProject.READ_CHUNK):
+            f.write(source[i:min(i + QETProject.READ_CHUNK, end)])
+
+
+    def _rebase(self, edits):
+        """Once saved over the source project, moves the located spans to
+        its position in the new file and clears the pending changes.
+        @param edits: list returned by _getEdits. None if the full mode was
+            used, so the positions are unknown now."""
+
+        self._dirty = set()
+        self._newTbs = []
+        self._sourceTbs = self._getTerminalBlocks( \
+                self.qet_project.find('collection').find('category'))
+
+        if edits is None:
+            self._spans = {}
+            self._tbSpans = {}
+            self._tbInsertAt = None
+            return
+
+        ends = [end for start, end, xml, node in edits]
+        shifts = [0]  # accumulated shift before every edit
+        for start, end, xml, node in edits:
+            shifts.append(shifts[-1] + len(xml) - (end - start))
+        move = lambda pos: pos + shifts[bisect_right(ends, pos)]
+
+        edited = {}
+        for start, end, xml, node in edits:
+            if isinstance(node, list):  # terminal blocks inserted
+                pos = move(start) - len(xml)
+                self._tbInsertAt = pos
+                for tb, size in node:
+                    edited[tb] = (pos, pos + size)
+                    pos += size
+            elif xml:  # terminal element
+                pos = move(start)
+                edited[node] = (pos, pos + len(xml))
+            else:  # terminal block removed
+                edited[node] = None
+
+        for uuid, (start, end) in list(self._spans.items()):
+            element = self._elements.get(uuid)
+            if element in edited:
+                self._spans[uuid] = edited[element]
+            else:
+                self._spans[uuid] = (move(start), move(end))
+        for tb, (start, end) in list(self._tbSpans.items()):
+            if tb in edited:
+                del self._tbSpans[tb]
+            else:
+                self._tbSpans[tb] = (move(start), move(end))
+        for tb in self._sourceTbs:
+            if tb in edited:  # inserted
+                self._tbSpans[tb] = edited[tb]
+
+
+    def _write(self, source, f):
+        """Copies 'source' to the opened file 'f' child by child of the
+        project, so only one folio is in memory at a time.
+        @param source: mmap of the QET project
+        @param f: binary file to write"""
+
+        logos = self._getLogosSpan(source)
+        depth = 0
+        root = None
+        head_written = False
+        for event, node in self._iterSource(source):
+            if event == 'start':
+                if depth == 0:
+                    root = node
+                elif depth == 1 and not head_written:  # root text is known now
+                    f.write(self._startTag(root))
+                    head_written = True
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth == 1:  # childs of the project
+                root.remove(node)
+                if node.tag == 'diagram' and self._dirty:
+                    for father in node.iter('elements'):
+                        for i, element in enumerate(father):
+                            if element.get('uuid') in self._dirty:  # edited
+                                edited = self._elements[element.get('uuid')]
+                                edited.tail = element.tail
+                                father[i] = edited
+                out = node
+                if node.tag == 'collection':
+                    out = self._getCollection()
+                    out.tail, node.tail = node.tail, out.tail
+                xml = etree.tostring(out)
+                if logos and QETProject.LOGOS_EMPTY in xml:  # put back the LOGO section
+                    i = xml.index(QETProject.LOGOS_EMPTY)
+                    f.write(xml[:i])
+                    f.write(source[logos[0]:logos[1]])
+                    xml = xml[i + len(QETProject.LOGOS_EMPTY):]
+                    logos = None
+                f.write(xml)
+                node.clear()
+            elif depth == 0:
+                if not head_written:
+                    f.write(self._startTag(root))
+                f.write('</{}>'.format(root.tag).encode())
+
+
+    def _startTag(self, node):
+        """Returns the start tag and the text of a node serialized.
+        @param node: XML etree object
+        @return: bytes"""
+
+        tag = etree.tostring(etree.Element(node.tag, node.attrib))  # <tag ... />
+        text = escape(node.text or '').encode('ascii', 'xmlcharrefreplace')
+        return tag[:-3] + b'>' + text
 
 
 
@@ -489,9 +1207,12 @@ class QETProject:
         """Inserts a xml node representing a terminal block,
         removing first the old element if exists
         @param name: name of the segment
-        @param tb_node: xml tree of the terminal block.
+        @param tb_node: xml tree of the terminal block, or the terminal block
+            already serialized (bytes). In this case only an empty <element>
+            is added to the tree and the bytes are written as is when saving.
         @return: none"""
         
+        self._ensureLoaded()
         element_name_to_delete = 'TB_' + name + '.elmt'
         father = self.qet_project.find('collection').find('category')
         
@@ -499,19 +1220,25 @@ class QETProject:
         for element in father.iter('element'):  # all elements in the imported collection
             if element.attrib['name'] == element_name_to_delete:
                 father.remove(element)
+                self._tbXml.pop(element, None)
+
+        if isinstance(tb_node, bytes):
+            xml, tb_node = tb_node, etree.Element('element', name=element_name_to_delete)
+            self._tbXml[tb_node] = xml
 
         # adding the element
         father.insert(0, tb_node)
+        self._newTbs.append(tb_node)
     
 
     def _get_tb_names(self):
         """
         Get a list of the terminal-block names sorted
         """
-        sort_key = [x['block_name'] for x in self.__used_terminals]
-        return list(OrderedDict.fromkeys(sort_key)) 
+        return list(self._get_blocks())
   
     
     # properties
     terminals = property(_get_used_terminals)
     tb_names = property(_get_tb_names)
+    blocks = property(_get_blocks)
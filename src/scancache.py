@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+
+"""Cache on disk of the terminals found in the QET projects.
+
+Reading a big project means to parse all its XML and scan every folio,
+although the project is the same as the last time it was opened. The
+cache keeps the result of the scan of the last projects opened, one file
+per project, and gives it back while the project has the same size and
+content. The least recently used projects are removed.
+
+When the project has changed, the data of its last scan is still given
+by get_previous, so the parts of the project not changed can be reused.
+"""
+
+
+# Imports
+import logging as log
+import hashlib
+import mmap
+import os
+import pickle
+import tempfile
+from collections import namedtuple
+
+
+# identity of the content of a project file
+Fingerprint = namedtuple('Fingerprint', ['size', 'mtime', 'hash'])
+
+
+
+class ScanCache:
+    """Results of the scan of QET projects, saved in a folder.
+
+    Every project has a file named by the hash of its path, with the
+    fingerprint of the project when it was scanned and the data. The time
+    of the file is the last time it was used. Any error reading or
+    writing the cache is logged and taken as a miss, so the cache never
+    stops the plugin.
+    """
+
+    VERSION = 2  # change it when the data cached changes
+    MAX_ENTRIES = 16  # projects kept
+    SUFFIX = '.pickle'
+
+
+    def __init__(self, folder, max_entries=None):
+        """initializer.
+        @param folder: where the cache files are. Created if needed.
+        @param max_entries: num of projects kept. MAX_ENTRIES by default"""
+
+        self.folder = folder
+        self.max_entries = max_entries or ScanCache.MAX_ENTRIES
+        self._outdated = {}  # data of the outdated entries read, by project
+
+
+    @staticmethod
+    def fingerprint(project_file):
+        """Returns the fingerprint of the current content of a project.
+        @param project_file: QET project file
+        @return: Fingerprint"""
+
+        with open(project_file, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as source:
+                    digest = hashlib.sha1(source).hexdigest()
+            else:
+                digest = hashlib.sha1().hexdigest()
+        return Fingerprint(stat.st_size, stat.st_mtime_ns, digest)
+
+
+    def get(self, project_file, fingerprint=None):
+        """Returns the data cached for a project if its content is the
+        same. The time may be different, i.e. QET saved it again.
+        @param project_file: QET project file
+        @param fingerprint: of the project. Computed if not specified.
+        @return: data or None"""
+
+        entry = self._read(project_file)
+        if entry is None:
+            return None
+        fingerprint = fingerprint or self.fingerprint(project_file)
+        cached = entry['fingerprint']
+        if cached.size != fingerprint.size or cached.hash != fingerprint.hash:
+            log.info('Cache of {} is outdated'.format(project_file))
+            self._outdated[os.path.abspath(project_file)] = entry['data']
+            return None
+        self._touch(project_file)
+        return entry['data']
+
+
+    def get_previous(self, project_file):
+        """Returns the data cached for a project, even if the project has
+        changed since.
+        @param project_file: QET project file
+        @return: data or None"""
+
+        data = self._outdated.pop(os.path.abspath(project_file), None)
+        if data is not None:  # already read by get
+            return data
+        entry = self._read(project_file)
+        return None if entry is None else entry['data']
+
+
+    def put(self, project_file, data, fingerprint=None):
+        """Saves the data of a project, removing the projects used least
+        recently if there are too many.
+        @param project_file: QET project file
+        @param data: anything that can be pickled
+        @param fingerprint: of the project when the data was taken"""
+
+        fingerprint = fingerprint or self.fingerprint(project_file)
+        entry = {'version': ScanCache.VERSION, \
+                'project': os.path.abspath(project_file), \
+                'fingerprint': fingerprint, 'data': data}
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.folder, prefix='.', \
+                    suffix=ScanCache.SUFFIX, delete=False) as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, self._getFile(project_file))
+            self._evict()
+        except Exception:
+            log.warning('Cannot save the cache of {}'.format(project_file), exc_info=True)
+
+
+    def _getFile(self, project_file):
+        """Returns the cache file of a project"""
+
+        key = hashlib.sha1(os.path.abspath(project_file).encode('utf-8')).hexdigest()
+        return os.path.join(self.folder, key + ScanCache.SUFFIX)
+
+
+    def _read(self, project_file):
+        """Returns the entry of a project, or None if missing or invalid"""
+
+        filename = self._getFile(project_file)
+        if not os.path.isfile(filename):
+            return None
+        try:
+            with open(filename, 'rb') as f:
+                entry = pickle.load(f)
+            if entry['version'] == ScanCache.VERSION and \
+                    entry['project'] == os.path.abspath(project_file):
+                return entry
+        except Exception:
+            log.warning('Invalid cache file {}'.format(filename), exc_info=True)
+        return None
+
+
+    def _touch(self, project_file):
+        """Marks the entry of a project as used now"""
+
+        try:
+            os.utime(self._getFile(project_file))
+        except OSError:
+            pass
+
+
+    def _evict(self):
+        """Removes the least recently used entries over max_entries"""
+
+        files = [os.path.join(self.folder, x) for x in os.listdir(self.folder) \
+                if x.endswith(ScanCache.SUFFIX) and not x.startswith('.')]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for filename in files[self.max_entries:]:
+            log.debug('Removing from the cache {}'.format(filename))
+            os.remove(filename)
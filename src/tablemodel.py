@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+# Imports
+import logging as log
+
+
+# values of the cells that change on click
+LOOPS = {
+    'bridge': {'' : '|', \
+               '|': ''},
+    'terminal_type': {''        : 'STANDARD', \
+                      'STANDARD': 'GROUND', \
+                      'GROUND'  : 'FUSE', \
+                      'FUSE'    : 'STANDARD'},
+}
+
+
+
+class TableModel:
+    """Terminals of the table of the GUI. The event handlers change the
+    terminals here and the table (see tableview) only shows them, so the
+    widgets are never read back.
+
+    Every row is a copy of a terminal of QETProject.terminals. The rows
+    are sorted by terminal block and the order of the rows is the order of
+    the terminals in its terminal block.
+    """
+
+    FIXED = ['terminal_pos', 'block_name']  # stay in the row when moving
+
+
+    def __init__(self, terminals):
+        """initializer.
+        @param terminals: list of Terminal, sorted by block"""
+
+        self.terminals = [t.copy() for t in terminals]
+
+        # alternate background color between terminal blocks, and
+        # the rows of every terminal block
+        self.colors = []
+        self.blocks = {}  # range of rows by terminal block name
+        color = 0; memo_block_name = None; first = 0
+        for i, t in enumerate(self.terminals):
+            if t['block_name'] != memo_block_name:
+                if memo_block_name is not None:
+                    self.blocks[memo_block_name] = range(first, i)
+                color = 1 - color
+                memo_block_name = t['block_name']
+                first = i
+            self.colors.append(color)
+        if memo_block_name is not None:
+            self.blocks[memo_block_name] = range(first, len(self.terminals))
+
+
+    def __len__(self):
+        return len(self.terminals)
+
+
+    def __getitem__(self, row):
+        return self.terminals[row]
+
+
+    def move(self, row, offset):
+        """Moves the terminal of a row up (-1) or down (+1) inside its
+        terminal block. The position stays in the row.
+        @param row: index of the terminal
+        @param offset: -1 or +1
+        @return: list of the rows changed. Empty if not moved."""
+
+        other = row + offset
+        if not 0 <= other < len(self.terminals):
+            return []
+        a, b = self.terminals[row], self.terminals[other]
+        if a['block_name'] != b['block_name']:  # not mix terminal blocks
+            return []
+
+        for k in TableModel.FIXED:
+            a[k], b[k] = b[k], a[k]
+        self.terminals[row], self.terminals[other] = b, a
+        log.debug('Terminal {} moved to row {}'.format(a['terminal_name'], other))
+        return [row, other]
+
+
+    def set_value(self, row, key, value):
+        """Sets a value of the terminal of a row"""
+
+        self.terminals[row][key] = value
+
+
+    def cycle(self, row, key):
+        """Sets the next value of LOOPS to a cell, i.e. bridge or type.
+        @param row: index of the terminal
+        @param key: key of LOOPS
+        @return: new value"""
+
+        loop = LOOPS[key]
+        value = loop.get(self.terminals[row][key], loop[''])
+        self.terminals[row][key] = value
+        return value
+
+
+    def get_rows(self, tb_names):
+        """Returns the rows of the terminals of some terminal blocks.
+        @param tb_names: list of terminal block names
+        @return: list of rows, sorted"""
+
+        rows = []
+        for block in self.get_blocks(tb_names):
+            rows.extend(block)
+        return rows
+
+
+    def get_blocks(self, tb_names):
+        """Returns the range of rows of some terminal blocks.
+        @param tb_names: list of terminal block names
+        @return: list of ranges, sorted"""
+
+        blocks = [self.blocks[x] for x in set(tb_names) if x in self.blocks]
+        return sorted(blocks, key=lambda x: x.start)
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+"""Views of the table of terminals of the GUI. The terminals are in a
+TableModel and the views write them to the widgets of the window, keyed
+'-col/slot-', where slot is a row of widgets.
+
+  - FullTable: one row of widgets per terminal.
+  - VirtualTable: only widgets for the visible rows and a slider.
+
+Both have the same methods, so the event handlers do not care about the
+view used. The handlers change the model through the view, that only
+updates the widgets of the rows changed.
+"""
+
+
+# Imports
+import logging as log
+from bisect import bisect_left
+
+
+class FullTable:
+    """Table with a row of widgets for every terminal, i.e. slot == row"""
+
+    def __init__(self, model, columns):
+        """initializer.
+        @param model: TableModel
+        @param columns: key of the terminal shown in every column of the
+            table. '' for columns with no value, like the buttons."""
+
+        self.model = model
+        self.columns = columns
+        self.window = None
+        self._shown = set(model.blocks)  # terminal blocks shown
+
+
+    def bind(self, window):
+        """Links the table to the window once it is finalized.
+        @param window: sg window class"""
+
+        self.window = window
+
+
+    def get_row(self, slot):
+        """Returns the index in the model of the terminal shown in a slot.
+        @param slot: row of widgets (int or str)
+        @return: int or None if the slot is empty"""
+
+        return int(slot)
+
+
+    def get_slot(self, row):
+        """Returns the slot that shows a row of the model, or None"""
+
+        return row
+
+
+    def get(self, slot):
+        """Returns the terminal shown in a slot, or None"""
+
+        row = self.get_row(slot)
+        return None if row is None else self.model[row]
+
+
+    def scroll(self, event, values=None):
+        """Returns True if 'event' scrolls the table, handling it"""
+
+        return False
+
+
+    def filter(self, tb_names, show_all=False):
+        """Shows only the terminals of some terminal blocks. Only the rows
+        of the terminal blocks that are shown or hidden now are changed.
+        To hide a row is enough to hide on element in the row layout.
+        @param tb_names: list of terminal block names
+        @param show_all: True to show all the terminals"""
+
+        shown = set(self.model.blocks) if show_all else \
+                set(tb_names) & set(self.model.blocks)
+
+        for block in self.model.get_blocks(self._shown - shown):
+            for row in block:
+                self.window['-2/{}-'.format(row)].hide_row()
+
+        # A row shown again goes to the end of the table, so it is put
+        # before the first row shown after it. From the end to the start,
+        # so that row is already in place.
+        after = None  # first row shown after the current block
+        for block in reversed(self.model.get_blocks(shown)):
+            if self.model[block[0]]['block_name'] not in self._shown:
+                for row in block:
+                    self._unhideRow(row, after)
+            after = block[0]
+        self._shown = shown
+
+
+    def _unhideRow(self, row, before=None):
+        """Shows a hidden row of widgets.
+        @param row: slot to show
+        @param before: slot of a visible row to put it before. None to put
+            it at the end of the table."""
+
+        element = self.window['-2/{}-'.format(row)]
+        if before is None:
+            element.unhide_row()
+        else:  # unhide_row() does not support it
+            frame = self.window['-2/{}-'.format(before)].ParentRowFrame
+            element.ParentRowFrame.pack(before=frame)
+
+
+    def move(self, slot, offset):
+        """Moves the terminal of a slot up (-1) or down (+1) inside its
+        terminal block.
+        @return: True if moved"""
+
+        row = self.get_row(slot)
+        if row is None:
+            return False
+        changed = self.model.move(row, offset)
+        self.render(changed)
+        return bool(changed)
+
+
+    def set_value(self, slot, key, value):
+        """Sets a value typed in a cell. The widget already shows it."""
+
+        row = self.get_row(slot)
+        if row is not None:
+            self.model.set_value(row, key, value)
+
+
+    def cycle(self, slot, key):
+        """Sets the next value to a cell that changes on click"""
+
+        row = self.get_row(slot)
+        if row is not None:
+            self.model.cycle(row, key)
+            self.render([row])
+
+
+    def render(self, rows=None):
+        """Writes the values of some terminals to its widgets, if shown.
+        @param rows: list of rows of the model. None for all the shown"""
+
+        window = self.window
+        if window is None:
+            return
+        for row in self._getShown() if rows is None else rows:
+            slot = self.get_slot(row)
+            if slot is None:
+                continue
+            terminal = self.model[row]
+            color = ['white', 'wheat1'][self.model.colors[row]]
+            for c, key in enumerate(self.columns):
+                if not key:
+                    continue
+                value = terminal[key]
+                window['-{}/{}-'.format(c, slot)].update( \
+                        value='' if value is None else value, \
+                        background_color=color)
+            window['-1/{}-'.format(slot)].metadata = terminal['uuid']
+
+
+    def _getShown(self):
+        """Returns the rows of the model that have widgets"""
+
+        return range(len(self.model))
+
+
+
+class VirtualTable(FullTable):
+    """Table with widgets only for the visible rows and a vertical slider.
+
+    Scrolling or filtering only writes the terminals now visible to the
+    same widgets, so the number of widgets does not depend on the size of
+    the project.
+    """
+
+    SCROLL_KEY = '-SCROLL-'  # key of the slider
+    TABLE_KEY = '-TABLE-'  # key of the column with the widgets
+    WHEEL_STEP = 3  # rows per step of the mouse wheel
+
+
+    def __init__(self, model, columns, view_rows):
+        """initializer.
+        @param model: TableModel
+        @param columns: key of the terminal shown in every column
+        @param view_rows: num of rows of widgets"""
+
+        super().__init__(model, columns)
+        self.view_rows = view_rows
+        self._view = list(range(len(model)))  # rows shown
+        self._top = 0  # index in _view of the first slot
+        self._hidden = set()  # slots with no terminal
+
+
+    def bind(self, window):
+        """Links the table to the window once it is finalized, and
+        binds the mouse wheel to scroll the table. The wheel events of
+        the cells do not reach the column, so they are bound to the window
+        and only the ones over the table scroll it, see scroll.
+        @param window: sg window class"""
+
+        self.window = window
+        window.bind('<MouseWheel>', '-WHEEL-')  # Windows, macOS
+        window.bind('<Button-4>', '-WHEEL_UP-')  # X11
+        window.bind('<Button-5>', '-WHEEL_DW-')
+        self._updateSlider()
+        self._render()
+
+
+    def get_row(self, slot):
+        i = self._top + int(slot)
+        if i < len(self._view):
+            return self._view[i]
+        return None
+
+
+    def get_slot(self, row):
+        i = bisect_left(self._view, row)  # _view is sorted
+        if i < len(self._view) and self._view[i] == row and \
+                self._top <= i < self._top + self.view_rows:
+            return i - self._top
+        return None
+
+
+    def scroll(self, event, values=None):
+        """Scrolls the table from a window event. Returns False if the event
+        is not a scroll event.
+        @param event: event of the window
+        @param values: values of the window
+        @return: True if the event was handled"""
+
+        if event == VirtualTable.SCROLL_KEY:
+            self.scroll_to(int(values[VirtualTable.SCROLL_KEY]))
+        elif event in ('-WHEEL-', '-WHEEL_UP-', '-WHEEL_DW-') and \
+                not self._isPointerOver():
+            pass  # the wheel over other widgets, i.e. the TB list
+        elif event == '-WHEEL-':
+            delta = self.window.user_bind_event.delta
+            self.scroll_to(self._top + [1, -1][delta > 0] * VirtualTable.WHEEL_STEP)
+        elif event == '-WHEEL_UP-':
+            self.scroll_to(self._top - VirtualTable.WHEEL_STEP)
+        elif event == '-WHEEL_DW-':
+            self.scroll_to(self._top + VirtualTable.WHEEL_STEP)
+        else:
+            return False
+        return True
+
+
+    def _isPointerOver(self):
+        """Returns True if the mouse pointer is over the table or its
+        slider"""
+
+        root = self.window.TKroot
+        widget = root.winfo_containing(*root.winfo_pointerxy())
+        if widget is None:
+            return False
+        path = str(widget)
+        for key in (VirtualTable.TABLE_KEY, VirtualTable.SCROLL_KEY):
+            parent = str(self.window[key].Widget)
+            if path == parent or path.startswith(parent + '.'):
+                return True
+        return False
+
+
+    def scroll_to(self, top):
+        """Shows the terminals from the position 'top' of the filtered ones"""
+
+        top = max(0, min(top, self._maxTop()))
+        if top != self._top:
+            self._top = top
+            self.window[VirtualTable.SCROLL_KEY].update(value=top)
+            self._render()
+
+
+    def filter(self, tb_names, show_all=False):
+        """Shows only the terminals of some terminal blocks.
+        @param tb_names: list of terminal block names
+        @param show_all: True to show all the terminals"""
+
+        if show_all:
+            self._view = list(range(len(self.model)))
+        else:
+            self._view = self.model.get_rows(tb_names)
+        self._top = 0
+        self._updateSlider()
+        self._render()
+
+
+    def _render(self):
+        """Writes all the slots, hiding the ones with no terminal"""
+
+        window = self.window
+        for slot in range(self.view_rows):
+            hide = self.get_row(slot) is None
+            if hide and slot not in self._hidden:
+                window['-2/{}-'.format(slot)].hide_row()
+                self._hidden.add(slot)
+            elif not hide and slot in self._hidden:
+                window['-2/{}-'.format(slot)].unhide_row()
+                self._hidden.discard(slot)
+        self.render()
+
+
+    def _getShown(self):
+        return self._view[self._top:self._top + self.view_rows]
+
+
+    def _maxTop(self):
+        """Returns the max. value of the first row shown"""
+
+        return max(0, len(self._view) - self.view_rows)
+
+
+    def _updateSlider(self):
+        """Sets the range of the slider to the terminals shown"""
+
+        if self.window is None:
+            return
+        # a vertical slider goes from the end of the range at the top,
+        # so the range is reversed to have the first row at the top
+        self.window[VirtualTable.SCROLL_KEY].update(value=self._top, \
+                range=(self._maxTop(), 0), disabled=not self._maxTop())
+        log.debug('Showing {} terminals'.format(len(self._view)))
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+"""The record of a terminal, shared by QETProject, TerminalBlock and the GUI.
+
+A Terminal has a slot per field, so it is smaller and faster to read than
+a dict. The fields are read as attributes (t.hose) in the hot code, and
+the mapping methods (t['hose'], t.get('hose'), dict(t)) are kept for the
+code that works with the terminals as dicts.
+"""
+
+
+# Imports
+from src import metadata
+
+
+# fields of a terminal, in order. See main.py for its meaning.
+FIELDS = ('uuid', 'block_name', 'terminal_name', 'terminal_xref', 'cable') + \
+        metadata.Metadata._fields
+
+
+
+class Terminal:
+    """A terminal of the project. The config fields default to the
+    metadata.DEFAULT values."""
+
+    __slots__ = FIELDS
+
+
+    def __init__(self, uuid='', block_name='', terminal_name='', \
+            terminal_xref='', cable='', terminal_pos=None, \
+            terminal_type=metadata.DEFAULT.terminal_type, hose='', \
+            conductor='', bridge='', num_reserve=metadata.DEFAULT.num_reserve, \
+            reserve_positions=metadata.DEFAULT.reserve_positions, \
+            size=metadata.DEFAULT.size):
+        self.uuid = uuid
+        self.block_name = block_name
+        self.terminal_name = terminal_name
+        self.terminal_xref = terminal_xref
+        self.cable = cable
+        self.terminal_pos = terminal_pos
+        self.terminal_type = terminal_type
+        self.hose = hose
+        self.conductor = conductor
+        self.bridge = bridge
+        self.num_reserve = num_reserve
+        self.reserve_positions = reserve_positions
+        self.size = size
+
+
+    @classmethod
+    def from_dict(cls, d):
+        """Returns a Terminal from a dict or any mapping. Missing fields
+        take the default value and unknown keys are ignored."""
+
+        return cls(**{k: d[k] for k in FIELDS if k in d})
+
+
+    def copy(self):
+        """Returns a shallow copy"""
+
+        new = Terminal.__new__(Terminal)
+        for k in FIELDS:
+            setattr(new, k, getattr(self, k))
+        return new
+
+
+    # mapping interface
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
+    def __setitem__(self, key, value):
+        if key not in FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+
+    def __contains__(self, key):
+        return key in FIELDS
+
+
+    def __iter__(self):
+        return iter(FIELDS)
+
+
+    def __len__(self):
+        return len(FIELDS)
+
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in FIELDS else default
+
+
+    def keys(self):
+        return FIELDS
+
+
+    def values(self):
+        return [getattr(self, k) for k in FIELDS]
+
+
+    def items(self):
+        return [(k, getattr(self, k)) for k in FIELDS]
+
+
+    def __eq__(self, other):
+        if not isinstance(other, Terminal):
+            return NotImplemented
+        return self.values() == other.values()
+
+
+    __hash__ = None  # mutable and equal by value, like the dict it replaces
+
+
+    def __repr__(self):
+        return 'Terminal({})'.format(', '.join( \
+                '{}={!r}'.format(k, v) for k, v in self.items()))
@@ -21,16 +21,133 @@
 
 # Imports
 import logging as log
+import operator
 import re
 import xml.etree.ElementTree as etree  # python3-lxml
-import uuid as uuidly
+
+from src.terminal import Terminal
+from src.uuids import UuidSource
+from src.xmltext import escape
+
+
+# style of the lines, rects and circles
+STYLE = 'line-style:normal;line-weight:normal;filling:none;color:black'
+
+# fields of the terminal written as texts of the column, and the mark of
+# its values and uuids in the templates of the columns
+TEXT_FIELDS = ('terminal_name', 'terminal_xref', 'cable', 'conductor')
+MARK = '\x01'
+HOSES_MARK = 'hoses'  # comment between the lines of the hoses. A label can
+                      # not be one, its '<' is escaped
+
+# marks of a column serialized: x coords., uuids and texts, see _ColumnX
+COLUMN_MARKS = re.compile('\x02(\\d+)|\x01(?=")|<(\\w+)>\x01(\\w+)</\\2>')
+
+
+
+def _rsub(a, b):
+    """operator.sub with the operands swapped, for _ColumnX.__rsub__"""
+
+    return b - a
+
+
+
+class _ColumnX:
+    """The x coord. of the terminal, or one computed from it, when drawing
+    the template of a column. The operations done are recorded, to repeat
+    them with the x coord. of every terminal, so the numbers are the same
+    as drawing the column there. Its text is a mark with its index in the
+    values of the operations.
+
+    Only +, -, * and / are recorded. Any other use of the value, i.e. a
+    comparison, round() or int(), raises TypeError: it can not be known
+    when drawing the template, and the columns would be wrong."""
+
+    MARK = '\x02'
+
+
+    def __init__(self, ops, index):
+        """initializer.
+        @param ops: list of the operations recorded, shared by all the
+            coords. of the column. Every operation is (function, index of
+            the 1st operand, 2nd operand, True if it is an index). The
+            values are the x coord. of the terminal and the result of every
+            operation, in order.
+        @param index: of the value"""
+
+        self.ops = ops
+        self.index = index
+
+
+    def _op(self, other, op):
+        if isinstance(other, _ColumnX):
+            new = (op, self.index, other.index, True)
+        else:
+            new = (op, self.index, other, False)
+        for i, x in enumerate(self.ops):  # done before, same types
+            if x == new and type(x[2]) is type(new[2]):
+                return _ColumnX(self.ops, i + 1)
+        self.ops.append(new)
+        return _ColumnX(self.ops, len(self.ops))
+
+
+    def __add__(self, other):
+        return self._op(other, operator.add)
+
+
+    def __radd__(self, other):
+        return self._op(other, operator.add)
+
+
+    def __sub__(self, other):
+        return self._op(other, operator.sub)
+
+
+    def __rsub__(self, other):
+        return self._op(other, _rsub)
+
+
+    def __mul__(self, other):
+        return self._op(other, operator.mul)
+
+
+    def __rmul__(self, other):
+        return self._op(other, operator.mul)
+
+
+    def __truediv__(self, other):
+        return self._op(other, operator.truediv)
+
+
+    def _unsupported(self, *args):
+        raise TypeError('The x coord. of a column template only supports ' \
+                '+, -, * and /')
+
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _unsupported
+    __bool__ = __int__ = __float__ = __index__ = __round__ = _unsupported
+    __trunc__ = __floor__ = __ceil__ = __neg__ = __pos__ = __abs__ = _unsupported
+    __floordiv__ = __rfloordiv__ = __mod__ = __rmod__ = _unsupported
+    __divmod__ = __rdivmod__ = __pow__ = __rpow__ = __rtruediv__ = _unsupported
+    __hash__ = None
+
+
+    def __str__(self):
+        return '{}{}'.format(_ColumnX.MARK, self.index)
+
+
+
+class _MarkUuids:
+    """Uuid source of the templates of the columns, see UuidSource"""
+
+    def new(self):
+        return MARK
+
 
 
 class TerminalBlock:
     """This class represents a Terminal Block for a QET project.
-    The list of terminals has dicts like:
-        {uuid, block_name, segment, terminal_name, terminal_pos, 
-        terminal_xref, terminal_type, conductor_name, cable, cable_cond}
+    The list of terminals has Terminal records (see terminal.py). Dicts
+    with the same keys are converted.
     """
 
     LOGO_HEIGHT = 36  #  the height of the FUSE LOGO for fuse type
@@ -42,12 +159,15 @@ class TerminalBlock:
         @param string tb_block_name: block_name
         @param collec: collection of terminals. Only the terminals of the
             segment 'tb_id' are accepted.
-        @param settings: dict with the settings
+        @param settings: dict with the settings. With '-CFG_STABLE_UUIDS-'
+            the uuids come from the name of the block, so the same block
+            is drawn with the same uuids every time.
         """
         self.tb_block_name = tb_block_name
-        self.terminals = collec
+        self.terminals = [t if isinstance(t, Terminal) else Terminal.from_dict(t) \
+                for t in collec]
         self.num_terminals = len(self.terminals)
-        self.tb_id = self.terminals[0]['block_name']
+        self.tb_id = self.terminals[0].block_name
         
         # set settings if defined or defaults
         self.HEAD_HEIGHT = [int( settings['-CFG_A-'] ), 120][settings=={}]
@@ -68,6 +188,9 @@ class TerminalBlock:
 
         self.SPLIT_SIZE = [int( settings['-CFG_SPLIT-'] ), 30][settings=={}]
 
+        self.uuids = UuidSource('TB_' + tb_block_name \
+                if settings.get('-CFG_STABLE_UUIDS-') else None)
+
 
 
     def _getNum(self, x):
@@ -125,8 +248,87 @@ class TerminalBlock:
         Creates a XML node of the terminal block.
         coord (0,0) al corner upper-left
 
+        Every element is built, so it is the reference of the faster
+        drawTerminalBlockBytes, that gives the same XML.
+
         @(param) self.terminals
-        @return: none"""
+        @return: root node"""
+
+        root, description, cursor = self._drawHead()
+        max_cond_name_length, max_hose_cond_name_length = self._getMaxNameLengths()
+
+        for trmnl, cursor in self._iterTerminals(description, cursor):
+            # draw the terminal and its conductors
+            self._drawColumn(description, cursor, trmnl, \
+                    max_cond_name_length, max_hose_cond_name_length)
+
+        #~ etree.ElementTree(root).write('tmp.xml') #, pretty_print=True)
+        return root
+
+
+    def drawTerminalBlockBytes(self):
+        """
+        Returns the XML of the terminal block, the same bytes as
+        etree.tostring(self.drawTerminalBlock()), but written directly.
+        Every terminal of the same kind (see _getColumnKey) is the same
+        column of elements moved to its x coord., so the column is drawn
+        once as a template and formatted as text for every terminal (see
+        _getColumnTemplate), with no xml nodes. Only the header and the lines
+        of the hoses are drawn as nodes and serialized.
+
+        @return: bytes"""
+
+        root, description, cursor = self._drawHead()
+        max_cond_name_length, max_hose_cond_name_length = self._getMaxNameLengths()
+
+        # the columns go at the end of the description, the last node
+        head = etree.tostring(root, encoding='unicode')
+        end = '</description></definition></element>'
+        out = [head[:-len(end)]]
+
+        # the lines of the hoses are serialized at once, with a comment
+        # after the ones drawn before every terminal to put them in place
+        extra = etree.Element('description')
+        hoses = []  # index in out of the lines of the hoses
+        columns = {}  # templates of the columns, by kind of terminal
+        drawn = 0
+        for trmnl, cursor in self._iterTerminals(extra, cursor):
+            if len(extra) > drawn:
+                extra.append(etree.Comment(HOSES_MARK))
+                drawn = len(extra)
+                hoses.append(len(out))
+                out.append(None)
+
+            key = self._getColumnKey(trmnl)
+            if key not in columns:
+                columns[key] = self._getColumnTemplate(key, \
+                        max_cond_name_length, max_hose_cond_name_length)
+            out.append(self._formatColumn(columns[key], cursor, trmnl))
+        if len(extra) > drawn:
+            extra.append(etree.Comment(HOSES_MARK))
+            hoses.append(len(out))
+            out.append(None)
+        if hoses:
+            xml = self._getChildrenXml(extra).split('<!--{}-->'.format(HOSES_MARK))
+            for i, lines in zip(hoses, xml):
+                out[i] = lines
+        out.append(end)
+
+        return ''.join(out).encode('us-ascii', 'xmlcharrefreplace')
+
+
+    def _getChildrenXml(self, node):
+        """Returns the XML text of the children of a node, with one
+        serialization. The node must have children."""
+
+        xml = etree.tostring(node, encoding='unicode')
+        return xml[xml.index('>') + 1:xml.rindex('<')]
+
+
+    def _drawHead(self):
+        """Creates the XML node of the terminal block with its definition,
+        the header and the union, but no terminals.
+        @return: (root node, description node, x coord. of the first terminal)"""
 
         # calc some values    
         name = 'TB_'+ self.tb_block_name  
@@ -179,123 +381,50 @@ class TerminalBlock:
         y1 = y_term_center - (self.UNION_HEIGHT / 2)  # upper left corner
         un = self._rect (description, x=cursor, y=y1, \
                 width=self.UNION_WIDTH, height=self.UNION_HEIGHT)
-                
-        # process every teminal
+
         cursor += self.UNION_WIDTH
-        last_trmnl = {}  
-        for k in self.terminals[0]: last_trmnl[k] = ''  # init last_trmnl
-        last_cable_coord_x = cursor
-        max_cond_name_length = max( [len(x['cable']) for x in self.terminals] )
-        max_hose_cond_name_length = max( [len(x['cable']) for x in self.terminals] )
-         # to align bottom cable labels because of the text goes to north direction.
+        return root, description, cursor
 
-        
+
+    def _getMaxNameLengths(self):
+        """Returns the max. length of the cable labels, to align the bottom
+        cable labels because of the text goes to north direction.
+        @return: (for the cables, for the hoses)"""
+
+        max_cond_name_length = max( [len(x.cable) for x in self.terminals] )
+        max_hose_cond_name_length = max( [len(x.cable) for x in self.terminals] )
+        return max_cond_name_length, max_hose_cond_name_length
+
+
+    def _iterTerminals(self, description, cursor):
+        """Goes through the terminals, drawing the lines of the hoses.
+        The terminal itself is drawn by the caller, so it is the same
+        for every way of drawing.
+        @param description: xml node where to draw the lines of the hoses
+        @param cursor: x coord. of the first terminal
+        @return: generator of (terminal, x coord. of the terminal). The
+            lines of the hoses up to a terminal are drawn after it is
+            yielded."""
+
+        last_trmnl = Terminal()  # init last_trmnl, no hose
+        last_cable_coord_x = cursor
         for i in range(0, self.num_terminals):
             trmnl = self.terminals[i]
-            x_term_center = cursor + (self.TERMINAL_WIDTH / 2)
-            
-            # draw terminal
-            term = self._rect(description, x=cursor, \
-                    y=y_term_center - (self.TERMINAL_HEIGHT /2 ), \
-                    width= self.TERMINAL_WIDTH, height= self.TERMINAL_HEIGHT)
-            term_label = self._label_term(description, \
-                    x=x_term_center, \
-                    y=y_term_center + (self.TERMINAL_HEIGHT / 2) - TerminalBlock.Y_OFFSET_BASE_TEXT, \
-                    text=trmnl['terminal_name'])
-            term_xref_label = self._label_term_xref(description, \
-                    x=x_term_center, \
-                    y=y_term_center - TerminalBlock.Y_OFFSET_BASE_TEXT, \
-                    text=trmnl['terminal_xref'])
-            
-            # draw fuse, ground,... logo
-            logo = self._type_term(description, \
-                    x=x_term_center, \
-                    y=y_term_center, typ=trmnl['terminal_type'])
-
-            # draw bridge if needed
-            if trmnl['bridge']:
-                bridge = self._line(description, x1=x_term_center, \
-                        x2=x_term_center + self.TERMINAL_WIDTH , \
-                        y1=y_term_center, y2=y_term_center)
-            
-            # draw north cables
-            north_cable = self._line(description, x1=x_term_center, x2=x_term_center, \
-                    y1 = 0, y2 = self.CONDUCTOR_LENGTH)
-            north_cable_label = self._label_cond(description, \
-                    x=x_term_center - self.CONDUCTOR_FONT - TerminalBlock.X_OFFSET_CABLE_TEXT, \
-                    y=self.CONDUCTOR_LENGTH - TerminalBlock.Y_OFFSET_BASE_TEXT + 3, \
-                    text=trmnl['cable'])
-            north_terminal = self._qet_term(description, x=cursor, y=0, orientation='n')
-
-
-            # draw south conductor depens if belongs or not a cable.
-            if trmnl['hose'] != '':  # belongs
-                
-                # hose conductor start part
-                south_cable = self._line (description, x1=x_term_center, x2=x_term_center, \
-                    y1 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT, \
-                    y2 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START)
-                south_cable_label = self._label_cond(description , \
-                    x=x_term_center - self.CONDUCTOR_FONT - TerminalBlock.X_OFFSET_CABLE_TEXT, \
-                    y=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_cond_name_length * self.CONDUCTOR_FONT), \
-                    text=trmnl['cable'])
-                conductor_label = self._label_cond(description , \
-                    x=x_term_center - self.CONDUCTOR_FONT - TerminalBlock.X_OFFSET_CABLE_TEXT, \
-                    y=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START, \
-                    text=trmnl['conductor'])
-                conductor_tick = self._line(description, \
-                    x1=cursor + self.TERMINAL_WIDTH/2 - 2, \
-                    x2=cursor + self.TERMINAL_WIDTH/2 + 2, \
-                    y1=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START-10 - 2, \
-                    y2=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START-10 + 2)
-
-                # hose conductor end part
-                y1 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START + self.HOSE_LENGTH
-                y2 = y1 + self.HOSE_CONDUCTOR_END
-                south_cable_end = self._line (description, x1=x_term_center, x2=x_term_center, \
-                    y1=y1, y2=y2
-                ) 
-                south_cable_end_label = self._label_cond(description , \
-                    x=x_term_center - self.CONDUCTOR_FONT - TerminalBlock.X_OFFSET_CABLE_TEXT, \
-                    y=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START + \
-                        self.HOSE_LENGTH + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_hose_cond_name_length * self.CONDUCTOR_FONT*1.5), \
-                    text=trmnl['conductor']
-                )    
-                conductor_tick_end = self._line(description, \
-                    x1=cursor + self.TERMINAL_WIDTH/2 - 2, \
-                    x2=cursor + self.TERMINAL_WIDTH/2 + 2, \
-                    y1=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START + \
-                        self.HOSE_LENGTH + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_hose_cond_name_length * self.CONDUCTOR_FONT*1.5)-10 -2, \
-                    y2=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START + \
-                        self.HOSE_LENGTH + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_hose_cond_name_length * self.CONDUCTOR_FONT*1.5)-10 +2
-                )
-                south_terminal = self._qet_term(description, cursor, y2, 's')
-            
-
-            else:  # independend conductor (no hose)
-                south_cable = self._line (description, x1=x_term_center, x2=x_term_center, \
-                        y1 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT,
-                        y2 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.CONDUCTOR_LENGTH)
-                south_cable_label = self._label_cond(description , \
-                    x=x_term_center - self.CONDUCTOR_FONT - 3, \
-                    y=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_cond_name_length * self.CONDUCTOR_FONT), \
-                    text=trmnl['cable'])
-                south_terminal = self._qet_term(description, x=cursor, \
-                    y=2*self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT , orientation='s')
+            yield trmnl, cursor
 
             # draw horizontal line across all hose conductors when end of hose is detected
             y1 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START
             y2 = y1 + self.HOSE_LENGTH
-            if ( (trmnl['hose'] != last_trmnl['hose']) and (last_trmnl['hose'] != '') ) \
+            if ( (trmnl.hose != last_trmnl.hose) and (last_trmnl.hose != '') ) \
                 or \
-               ( (last_trmnl['hose'] != '') and (i == self.num_terminals - 1) ):  # hose change or the hose arrives to the last term
+               ( (last_trmnl.hose != '') and (i == self.num_terminals - 1) ):  # hose change or the hose arrives to the last term
                     
                 x1 = last_cable_coord_x + (self.TERMINAL_WIDTH / 2)
                 x2 = cursor - (self.TERMINAL_WIDTH / 2)
                 
                 # Change coord for horizontal line    
                 if i == self.num_terminals - 1:
-                    if trmnl['hose'] == last_trmnl['hose']:
+                    if trmnl.hose == last_trmnl.hose:
                         x2 = x2 + self.TERMINAL_WIDTH 
 
                 hor_line1 = self._line(description, x1, x2, y1, y1)
@@ -303,23 +432,23 @@ class TerminalBlock:
                 ver_line = self._line(description, (x1+x2)/2, (x1+x2)/2, y1, y2)
                 ver_line_label = self._label_cond(description, \
                         (x1+x2)/2 - self.TERMINAL_WIDTH + 10, \
-                        y1 + ((y2-y1)/2) + len(last_trmnl['hose'])*1.3, \
-                        last_trmnl['hose'])
+                        y1 + ((y2-y1)/2) + len(last_trmnl.hose)*1.3, \
+                        last_trmnl.hose)
                  
 
             # Last terminal belongs to a individual hose
-            if ( (last_trmnl['hose'] == '') and trmnl['hose'] !='' and (i == self.num_terminals - 1) ):  
+            if ( (last_trmnl.hose == '') and trmnl.hose !='' and (i == self.num_terminals - 1) ):  
                 
                 x1 = cursor  + (self.TERMINAL_WIDTH / 2)
                 ver_line = self._line(description, x1, x1, y1, y2)
                 ver_line_label = self._label_cond(description, \
                 x1 - 10, \
-                y1 + ((y2-y1)/2) + len(trmnl['hose'])*1.3, \
-                trmnl['hose'])                   
+                y1 + ((y2-y1)/2) + len(trmnl.hose)*1.3, \
+                trmnl.hose)                   
 
                         
             # memo of x coord.
-            if trmnl['hose'] != last_trmnl['hose']:
+            if trmnl.hose != last_trmnl.hose:
                 last_cable_coord_x = cursor
 
                 
@@ -328,13 +457,208 @@ class TerminalBlock:
             last_trmnl = trmnl
 
 
+    def _getColumnKey(self, trmnl):
+        """Returns the kind of column of a terminal: the elements drawn
+        depend on the type of the logo, the bridge and the hose."""
+
+        typ = trmnl.terminal_type.lower()
+        if typ not in ('ground', 'fuse'):
+            typ = ''  # circle
+        return typ, bool(trmnl.bridge), trmnl.hose != ''
+
+
+    def _getColumnTemplate(self, key, max_cond_name_length, \
+            max_hose_cond_name_length):
+        """Returns the XML text of a column as a template. The column is
+        drawn once by _drawColumn for a terminal of its kind, so the
+        geometry is only there: the x coord. of the terminal is a _ColumnX
+        and the uuids and the texts of the terminal are marks, where the
+        values of every terminal go.
+        @param key: see _getColumnKey
+        @return: (parts, get, xs, written, num of uuids, text fields):
+              - parts: list with the constant text in the even positions,
+                the odd ones are for the values.
+              - get: function that returns the values of the odd positions
+                from the values of the terminal: the values of xs in
+                'written', the uuids and the children with the text of the
+                fields, in order.
+              - xs: the operations that compute the x coords. from the one
+                of the terminal, see _ColumnX.
+              - fields: list of (start tag, end tag, empty tag, field)."""
+
+        typ, bridge, hose = key
+        trmnl = Terminal(terminal_type=typ or 'STANDARD', \
+                bridge='|' if bridge else '', hose=MARK if hose else '', \
+                **{k: MARK + k for k in TEXT_FIELDS})
+        xs = []
+        description = etree.Element('description')
+        uuids = self.uuids
+        self.uuids = _MarkUuids()
+        try:
+            self._drawColumn(description, _ColumnX(xs, 0), trmnl, \
+                    max_cond_name_length, max_hose_cond_name_length)
+        finally:
+            self.uuids = uuids
+
+        xml = self._getChildrenXml(description)
+        written = sorted({int(x) for x in re.findall(_ColumnX.MARK + r'(\d+)', xml)})
+        num_uuids = xml.count('uuid="{}"'.format(MARK))
+        fields = []
+        parts = []
+        order = []  # index of the value of every mark
+        pos = 0
+        uuid = len(written)
+        for match in COLUMN_MARKS.finditer(xml):
+            x, tag, name = match.groups()
+            parts.append(xml[pos:match.start()])
+            pos = match.end()
+            if x:
+                order.append(written.index(int(x)))
+            elif not tag:
+                order.append(uuid)
+                uuid += 1
+            else:
+                fields.append( ('<{}>'.format(tag), '</{}>'.format(tag), \
+                        '<{} />'.format(tag), name) )
+                order.append(len(written) + num_uuids + len(fields) - 1)
+        parts.append(xml[pos:])
+
+        template = [None] * (2 * len(parts) - 1)
+        template[0::2] = parts
+        return template, operator.itemgetter(*order), xs, written, num_uuids, fields
+
+
+    def _formatColumn(self, column, cursor, trmnl):
+        """Returns the XML text of the column of a terminal.
+        @param column: see _getColumnTemplate
+        @param cursor: x coord. of the left side of the terminal
+        @param trmnl: Terminal
+        """
 
-        #~ etree.ElementTree(root).write('tmp.xml') #, pretty_print=True)
-        return root
+        template, get, xs, written, num_uuids, fields = column
+        x = [cursor]
+        for op, a, b, node in xs:
+            x.append(op(x[a], x[b] if node else b))
+        values = [str(x[i]) for i in written]
+        values.extend(self.uuids.take(num_uuids))
+        for start, end, empty, field in fields:
+            text = getattr(trmnl, field)
+            if not text:
+                values.append(empty)
+                continue
+            if '&' in text or '<' in text or '>' in text:
+                text = escape(text)
+            values.append(start + text + end)
+        xml = template[:]
+        xml[1::2] = get(values)
+        return ''.join(xml)
+
+
+    def _drawColumn(self, description, cursor, trmnl, max_cond_name_length, \
+            max_hose_cond_name_length):
+        """Draws a terminal and its conductors, element by element.
+        @param description: xml node of the drawing
+        @param cursor: x coord. of the left side of the terminal
+        @param trmnl: Terminal
+        @param max_cond_name_length: to align the bottom cable labels
+        @param max_hose_cond_name_length: to align the bottom hose labels
+        """
+
+        x_term_center = cursor + (self.TERMINAL_WIDTH / 2)
+        y_term_center = self.CONDUCTOR_LENGTH + (self.TERMINAL_HEIGHT / 2)
+
+        # draw terminal
+        term = self._rect(description, x=cursor, \
+                y=y_term_center - (self.TERMINAL_HEIGHT /2 ), \
+                width= self.TERMINAL_WIDTH, height= self.TERMINAL_HEIGHT)
+        term_label = self._label_term(description, \
+                x=x_term_center, \
+                y=y_term_center + (self.TERMINAL_HEIGHT / 2) - TerminalBlock.Y_OFFSET_BASE_TEXT, \
+                text=trmnl.terminal_name)
+        term_xref_label = self._label_term_xref(description, \
+                x=x_term_center, \
+                y=y_term_center - TerminalBlock.Y_OFFSET_BASE_TEXT, \
+                text=trmnl.terminal_xref)
+
+        # draw fuse, ground,... logo
+        logo = self._type_term(description, \
+                x=x_term_center, \
+                y=y_term_center, typ=trmnl.terminal_type)
+
+        # draw bridge if needed
+        if trmnl.bridge:
+            bridge = self._line(description, x1=x_term_center, \
+                    x2=x_term_center + self.TERMINAL_WIDTH , \
+                    y1=y_term_center, y2=y_term_center)
+
+        # draw north cables
+        north_cable = self._line(description, x1=x_term_center, x2=x_term_center, \
+                y1 = 0, y2 = self.CONDUCTOR_LENGTH)
+        north_cable_label = self._label_cond(description, \
+                x=x_term_center - self.CONDUCTOR_FONT - TerminalBlock.X_OFFSET_CABLE_TEXT, \
+                y=self.CONDUCTOR_LENGTH - TerminalBlock.Y_OFFSET_BASE_TEXT + 3, \
+                text=trmnl.cable)
+        north_terminal = self._qet_term(description, x=cursor, y=0, orientation='n')
+
+
+        # draw south conductor depens if belongs or not a cable.
+        if trmnl.hose != '':  # belongs
+
+            # hose conductor start part
+            south_cable = self._line (description, x1=x_term_center, x2=x_term_center, \
+                y1 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT, \
+                y2 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START)
+            south_cable_label = self._label_cond(description , \
+                x=x_term_center - self.CONDUCTOR_FONT - TerminalBlock.X_OFFSET_CABLE_TEXT, \
+                y=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_cond_name_length * self.CONDUCTOR_FONT), \
+                text=trmnl.cable)
+            conductor_label = self._label_cond(description , \
+                x=x_term_center - self.CONDUCTOR_FONT - TerminalBlock.X_OFFSET_CABLE_TEXT, \
+                y=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START, \
+                text=trmnl.conductor)
+            conductor_tick = self._line(description, \
+                x1=cursor + self.TERMINAL_WIDTH/2 - 2, \
+                x2=cursor + self.TERMINAL_WIDTH/2 + 2, \
+                y1=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START-10 - 2, \
+                y2=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START-10 + 2)
+
+            # hose conductor end part
+            y1 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START + self.HOSE_LENGTH
+            y2 = y1 + self.HOSE_CONDUCTOR_END
+            south_cable_end = self._line (description, x1=x_term_center, x2=x_term_center, \
+                y1=y1, y2=y2
+            ) 
+            south_cable_end_label = self._label_cond(description , \
+                x=x_term_center - self.CONDUCTOR_FONT - TerminalBlock.X_OFFSET_CABLE_TEXT, \
+                y=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START + \
+                    self.HOSE_LENGTH + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_hose_cond_name_length * self.CONDUCTOR_FONT*1.5), \
+                text=trmnl.conductor
+            )    
+            conductor_tick_end = self._line(description, \
+                x1=cursor + self.TERMINAL_WIDTH/2 - 2, \
+                x2=cursor + self.TERMINAL_WIDTH/2 + 2, \
+                y1=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START + \
+                    self.HOSE_LENGTH + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_hose_cond_name_length * self.CONDUCTOR_FONT*1.5)-10 -2, \
+                y2=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.HOSE_CONDUCTOR_START + \
+                    self.HOSE_LENGTH + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_hose_cond_name_length * self.CONDUCTOR_FONT*1.5)-10 +2
+            )
+            south_terminal = self._qet_term(description, cursor, y2, 's')
+
+
+        else:  # independend conductor (no hose)
+            south_cable = self._line (description, x1=x_term_center, x2=x_term_center, \
+                    y1 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT,
+                    y2 = self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + self.CONDUCTOR_LENGTH)
+            south_cable_label = self._label_cond(description , \
+                x=x_term_center - self.CONDUCTOR_FONT - 3, \
+                y=self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT + TerminalBlock.Y_OFFSET_BASE_TEXT + (max_cond_name_length * self.CONDUCTOR_FONT), \
+                text=trmnl.cable)
+            south_terminal = self._qet_term(description, x=cursor, \
+                y=2*self.CONDUCTOR_LENGTH + self.TERMINAL_HEIGHT , orientation='s')
 
 
     def _element_definitions(self, father, name):
-        sUUID = '{' + uuidly.uuid1().urn[9:] + '}'
+        sUUID = self.uuids.new()
         uuid = etree.SubElement(father, 'uuid', uuid=sUUID)
         
         names = etree.SubElement(father, 'names')
@@ -367,7 +691,7 @@ class TerminalBlock:
                 y=str(self.HEAD_HEIGHT + 5), \
                 z='2', \
                 text_from='ElementInfo', text_width='-1', \
-                uuid = '{' + uuidly.uuid1().urn[9:] + '}', \
+                uuid = self.uuids.new(), \
                 font_size='10', frame='false')
         label_text = etree.SubElement(label, 'text')
         label_text.text = self.tb_id
@@ -422,7 +746,7 @@ class TerminalBlock:
         """Generates a xml element that represents a line verticalcentered 
         on the terminal
         """
-        ls = 'line-style:normal;line-weight:normal;filling:none;color:black'
+        ls = STYLE
         return etree.SubElement(father, 'circle', \
                         x = str(x), y = str(y), diameter = str(diameter), \
                         antialias = 'false', \
@@ -433,7 +757,7 @@ class TerminalBlock:
         """Generates a xml element that represents a line  
         on the terminal
         """
-        ls = 'line-style:normal;line-weight:normal;filling:none;color:black'
+        ls = STYLE
         return etree.SubElement(father, 'line', \
                         x1 = str(x1), \
                         x2 = str(x2), \
@@ -451,7 +775,7 @@ class TerminalBlock:
         """Generates a xml element that represents a line vertical centered 
         on the terminal
         """
-        style = 'line-style:normal;line-weight:normal;filling:none;color:black'
+        style = STYLE
         return etree.SubElement(father, 'rect', \
                     x = str(x), \
                     y = str(y), \
@@ -486,7 +810,7 @@ class TerminalBlock:
                 y=str(y), \
                 z='3', \
                 text_from='UserText', \
-                uuid = '{' + uuidly.uuid1().urn[9:] + '}', \
+                uuid = self.uuids.new(), \
                 font_size=str(size), frame='false', \
                 rotation='270')
         label_text = etree.SubElement(label, 'text')
@@ -511,7 +835,7 @@ class TerminalBlock:
                 y=str(y), \
                 z='3', \
                 text_from='UserText', \
-                uuid = '{' + uuidly.uuid1().urn[9:] + '}', \
+                uuid = self.uuids.new(), \
                 font_size=str(size), frame='false', \
                 rotation='270')
         label_text = etree.SubElement(label, 'text')
@@ -537,7 +861,7 @@ class TerminalBlock:
                 y=str(y1), \
                 z='3', \
                 text_from='UserText', \
-                uuid = '{' + uuidly.uuid1().urn[9:] + '}', \
+                uuid = self.uuids.new(), \
                 font_size=str(size), frame='false', \
                 rotation='270')
         label_text = etree.SubElement(label, 'text')
@@ -562,7 +886,7 @@ class TerminalBlock:
                 y=str(y), \
                 z='3', \
                 text_from='UserText', \
-                uuid = '{' + uuidly.uuid1().urn[9:] + '}', \
+                uuid = self.uuids.new(), \
                 font_size=str(size), frame='false', \
                 rotation='270')
         label_text = etree.SubElement(label, 'text')
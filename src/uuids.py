@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+
+"""Source of the uuids of the elements generated by the plugin.
+
+uuid.uuid1() asks the system for the time and the node for every uuid, and
+a terminal block has about four labels per terminal. A UuidSource makes
+the random (or seeded) part once and then only counts.
+"""
+
+
+# Imports
+import hashlib
+import os
+import uuid as uuidly
+
+
+class UuidSource:
+    """Uuids of the elements of a terminal block, written as QET does:
+    '{6ba7b810-9dad-41d1-80b4-00c04fd430c8}'.
+
+    All the uuids of a source share the first 80 bits, random or derived
+    from a seed, and count up in the last 48 bits (the node field). So
+    they are unique inside the source, and a new one is just formatting.
+    With a seed, the same seed gives the same uuids in the same order, so
+    regenerating an unchanged terminal block gives the same XML.
+    """
+
+    MASK = 0xffffffffffff  # the 48 bits counted
+
+
+    def __init__(self, seed=None):
+        """initializer.
+        @param seed: text to derive the uuids from (version 5, name based).
+            None for random ones (version 4)."""
+
+        if seed is None:
+            value = uuidly.UUID(bytes=os.urandom(16), version=4)
+        else:
+            value = uuidly.UUID(bytes=hashlib.sha1(seed.encode('utf-8')).digest()[:16], \
+                    version=5)
+        value = str(value)
+        self._prefix = '{' + value[:24]
+        self._count = int(value[24:], 16)
+
+
+    def new(self):
+        """Returns the next uuid"""
+
+        count = self._count
+        self._count = (count + 1) & UuidSource.MASK
+        return '%s%012x}' % (self._prefix, count)
+
+
+    def take(self, num):
+        """Returns a list with the next 'num' uuids"""
+
+        count = self._count
+        self._count = (count + num) & UuidSource.MASK
+        prefix = self._prefix
+        return ['%s%012x}' % (prefix, (count + i) & UuidSource.MASK) \
+                for i in range(num)]
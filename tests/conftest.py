@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+"""Fixtures of the tests. See projects.py"""
+
+
+# Imports
+import pytest
+
+from tests.projects import make_project
+
+
+
+@pytest.fixture
+def project_file(tmp_path):
+    """A synthetic QET project in a temp folder"""
+
+    return make_project(str(tmp_path / 'project.qet'))
+
+
+@pytest.fixture
+def settings():
+    """Default settings with stable uuids, so the output is repeatable"""
+
+    from src.generator import DEFAULT_SETTINGS
+    return dict(DEFAULT_SETTINGS, **{'-CFG_STABLE_UUIDS-': True})
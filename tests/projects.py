@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+"""Synthetic QET projects for the tests: several folios with terminals of
+some terminal blocks, conductors, a LOGO section with undeclared
+namespaces and the terminal elements in the collection.
+"""
+
+
+# Imports
+import random
+import re
+import uuid as uuidly
+import xml.etree.ElementTree as etree
+
+
+BLOCKS = ['X1', 'X2', '-XL3', 'X10']
+FOLIO_LABELS = ['%autonum', 'F%id/%total', 'Pag %id']
+
+
+
+def make_folio(rnd, page, elements=20):
+    """Returns the XML of a <diagram> with terminals and other elements"""
+
+    u = lambda: '{%s}' % uuidly.UUID(int=rnd.getrandbits(128))
+    ret = []
+    w = ret.append
+    w('    <diagram order="%d" title="Page %d" folio="%s" cols="17" ' \
+            'colsize="60" rows="8" rowsize="80" version="0.80" machine="M%d">\n' \
+            % (page, page, FOLIO_LABELS[page % 3], page))
+    w('        <elements>\n')
+    conductors = []
+    for e in range(elements):
+        uuid, t1, t2 = u(), u(), u()
+        x, y = rnd.randint(30, 1000), rnd.randint(30, 600)
+        if e % 4 == 3:
+            kind, label = 'motors/motor.elmt', '-M%d' % e
+        else:
+            kind = 'terminals/terminal.elmt' if e % 3 else 'terminals/terminal_fuse.elmt'
+            label = '%s:%d' % (rnd.choice(BLOCKS), rnd.randint(1, 60))
+        w('            <element type="embed://import/%s" uuid="%s" x="%d" y="%d" ' \
+                'orientation="0" prefix="X">\n' % (kind, uuid, x, y))
+        w('                <terminals>\n' \
+                '                    <terminal id="%s" x="0" y="-4" orientation="0"/>\n' \
+                '                    <terminal id="%s" x="0" y="4" orientation="2"/>\n' \
+                '                </terminals>\n' % (t1, t2))
+        w('                <elementInformations>\n')
+        w('                    <elementInformation name="%s" show="1">%s</elementInformation>\n' \
+                % ('label' if e % 2 else 'formula', label))
+        if e % 7 == 2:
+            w('                    <elementInformation name="function" show="0">' \
+                    '%%p%d%%tFUSE%%hW%d%%n%d%%b|%%</elementInformation>\n' % (e, page, e))
+        elif e % 7 == 4:
+            w('                    <elementInformation name="function" show="0">' \
+                    '%tGROUND%hcable ñ%n%r3%z%s20</elementInformation>\n')
+        w('                </elementInformations>\n')
+        if e % 6 == 0:
+            w('                <dynamic_texts>\n' \
+                    '                    <dynamic_elmt_text text_from="ElementInfo" uuid="%s">' \
+                    '<text>%s</text></dynamic_elmt_text>\n' \
+                    '                </dynamic_texts>\n' % (u(), label))
+        w('            </element>\n')
+        if rnd.random() < 0.7:
+            conductors.append( (t1, rnd.randint(1, 999)) )
+        if rnd.random() < 0.5:
+            conductors.append( (t2, rnd.randint(1, 999)) )
+    w('        </elements>\n        <conductors>\n')
+    for terminal, num in conductors:
+        w('            <conductor terminal1="%s" terminal2="%s" num="%d" ' \
+                'type="multi"/>\n' % (terminal, u(), num))
+    w('        </conductors>\n    </diagram>\n')
+    return ''.join(ret)
+
+
+
+def make_project(filename, pages=5, seed=1):
+    """Writes a synthetic QET project.
+    @param filename: file to write
+    @param pages: num of folios
+    @param seed: of the random contents
+    @return: filename"""
+
+    rnd = random.Random(seed)
+    ret = ['<?xml version="1.0" encoding="UTF-8"?>\n' \
+            '<project version="0.80" title="Test &amp; ñ" folioSheetQuantity="1">\n' \
+            '    <properties>\n' \
+            '        <property name="saveddate" show="1">x</property>\n' \
+            '    </properties>\n' \
+            '    <titleblocktemplates>\n' \
+            '        <titleblocktemplate name="tb1">\n' \
+            '            <information>info</information>\n' \
+            '            <logos>\n' \
+            '                <logo name="a.svg" type="svg" storage="xml"><svg ' \
+            'xmlns="http://www.w3.org/2000/svg" sodipodi:docname="a.svg">' \
+            '<inkscape:g inkscape:label="Ñ capa"/></svg></logo>\n' \
+            '            </logos>\n' \
+            '        </titleblocktemplate>\n' \
+            '    </titleblocktemplates>\n' \
+            '    <newdiagrams>\n' \
+            '        <border cols="17"/>\n' \
+            '        <report label="%f-%l%c"/>\n' \
+            '    </newdiagrams>\n']
+    ret += [make_folio(rnd, page) for page in range(1, pages + 1)]
+    ret.append('    <collection>\n' \
+            '        <category name="import">\n' \
+            '            <names>\n' \
+            '                <name lang="en">Imported</name>\n' \
+            '            </names>\n' \
+            '            <category name="terminals">\n')
+    for name, link_type in (('terminal.elmt', 'terminal'), \
+            ('terminal_fuse.elmt', 'terminal'), ('motor.elmt', 'simple')):
+        ret.append('                <element name="%s">\n' \
+                '                    <definition type="element" link_type="%s" ' \
+                'width="20" height="20"/>\n' \
+                '                </element>\n' % (name, link_type))
+    ret.append('            </category>\n' \
+            '        </category>\n' \
+            '    </collection>\n' \
+            '</project>\n')
+    with open(filename, 'w', encoding='utf8') as f:
+        f.write(''.join(ret))
+    return filename
+
+
+
+def read(filename):
+    """Returns the bytes of a file"""
+
+    with open(filename, 'rb') as f:
+        return f.read()
+
+
+
+def parse(filename):
+    """Parses a project like QET does, checking it is well-formed. The
+    LOGO section has undeclared namespaces, so it is checked apart.
+    @return: project XML etree object"""
+
+    xml = read(filename)
+    logos = re.compile(rb'<logos>.*</logos>', re.S)
+    for match in logos.finditer(xml):
+        etree.fromstring(re.sub(rb'(</?|\s)\w+:', rb'\1', match.group(0)))
+    return etree.fromstring(logos.sub(b'<logos />', xml))
+
+
+
+def edit_on_disk(filename, old, new):
+    """Changes the project file like QET saving it again"""
+
+    xml = read(filename)
+    assert old in xml
+    with open(filename, 'wb') as f:
+        f.write(xml.replace(old, new, 1))
+
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+# Imports
+import random
+import shutil
+
+import pytest
+
+from src import generator
+from src.qetproject import QETProject
+from tests.projects import read
+
+
+
+def baseline_slicing(terminals, tb_list, max_tb_length):
+    """The slicing loop of create_terminal_blocks before iter_blocks,
+    without the drawing. Quadratic, but the reference."""
+
+    ret = []
+    filtered_tb = [ t for t in terminals if t['block_name'] in tb_list]
+    memo_tb_name = filtered_tb[0]['block_name']
+    current_tb = []
+    tb_done = []
+    for t in filtered_tb:
+        if t['block_name'] == memo_tb_name and len(current_tb) < int(max_tb_length):
+            current_tb.append(t)
+        else:
+            current_tb_name = current_tb[0]['block_name']
+            tb_done.append( current_tb_name )
+            ret.append( (current_tb_name, tb_done.count( current_tb_name), \
+                    len([1 for x in filtered_tb if x['block_name'] == current_tb_name]) >  max_tb_length, \
+                    current_tb) )
+            current_tb = [t]
+            memo_tb_name = current_tb[0]['block_name']
+    current_tb_name = current_tb[0]['block_name']
+    tb_done.append( current_tb_name )
+    ret.append( (current_tb_name, tb_done.count( t['block_name'] ), \
+            len([1 for x in filtered_tb if x['block_name'] == current_tb_name]) >  max_tb_length, \
+            current_tb) )
+    return ret
+
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_slicing_same_as_baseline(seed):
+    rnd = random.Random(seed)
+    names = ['X{}'.format(i) for i in range(rnd.randint(1, 8))]
+    terminals = []
+    for i in range(rnd.randint(1, 300)):
+        name = terminals[-1]['block_name'] if terminals and rnd.random() < 0.9 \
+                else rnd.choice(names)  # runs, a TB can be in several
+        terminals.append({'block_name': name, 'terminal_name': str(i)})
+    tb_list = rnd.sample(names, rnd.randint(1, len(names)))
+    if not any(t['block_name'] in tb_list for t in terminals):
+        tb_list.append(terminals[0]['block_name'])
+    split = rnd.choice([1, 2, 7, 30, 1000])
+
+    assert list(generator.iter_blocks(terminals, tb_list, split)) == \
+            baseline_slicing(terminals, tb_list, split)
+
+
+def test_slicing_nothing():
+    assert list(generator.iter_blocks([{'block_name': 'X1'}], ['X2'], 30)) == []
+
+
+
+def test_pool_same_output(project_file, settings, tmp_path, monkeypatch):
+    pooled = str(tmp_path / 'pooled.qet')
+    shutil.copy(project_file, pooled)
+    generator.generate(project_file, settings=settings)
+    monkeypatch.setattr(generator, 'PARALLEL_MIN_TERMINALS', 0)
+    stats = generator.generate(pooled, settings=settings, workers=2)
+
+    assert stats['blocks'] > 2
+    assert read(pooled) == read(project_file)
+
+
+def test_small_projects_not_pooled(project_file, settings, monkeypatch):
+    def pool(*args, **kwargs):
+        raise AssertionError('pool started')
+    monkeypatch.setattr(generator.concurrent.futures, 'ProcessPoolExecutor', pool)
+    project = QETProject(project_file)
+    assert generator.create_terminal_blocks(project, project.terminals, \
+            project.tb_names, 1, settings, workers=4) == len(project.terminals)
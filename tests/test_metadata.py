@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+# Imports
+import random
+
+import pytest
+
+from src import metadata
+from src.metadata import Metadata, DEFAULT
+
+
+
+def random_metadata(rnd):
+    text = lambda: ''.join(rnd.choice('abcXY1|-_ ñ') for i in range(rnd.randint(0, 5)))
+    return Metadata(
+            rnd.choice([None, rnd.randint(0, 500)]),
+            rnd.choice(['STANDARD', 'GROUND', 'FUSE', 'other']),
+            text(), text(), rnd.choice(['', '|']),
+            rnd.randint(0, 9), text(), rnd.randint(0, 200))
+
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_round_trip(seed):
+    rnd = random.Random(seed)
+    for i in range(100):
+        m = random_metadata(rnd)
+        assert metadata.parse(metadata.serialize(m)) == m
+
+
+@pytest.mark.parametrize('meta, expected', [
+    (None, DEFAULT),
+    ('', DEFAULT),
+    ('%p2%tSTANDARD%hW1%n3%b|%r0%z%s30', Metadata(2, 'STANDARD', 'W1', '3', '|', 0, '', 30)),
+    ('%p7%tFUSE%hW2%n1%b%', Metadata(7, 'FUSE', 'W2', '1', '', 0, '', 30)),  # old plugin
+    ('%p%t%h%n%b%r%z%s', DEFAULT),
+    ('%tGROUND%s12%p3', DEFAULT._replace(terminal_pos=3, terminal_type='GROUND', size=12)),
+    ('%p1%p2%tFUSE%tGROUND', DEFAULT._replace(terminal_pos=1, terminal_type='FUSE')),
+    ('%pX%p4%q1%s', DEFAULT._replace(terminal_pos=4)),  # invalid and unknown tags
+    ('text%hW1', DEFAULT._replace(hose='W1')),
+])
+def test_parse(meta, expected):
+    assert metadata.parse(meta) == expected
+
+
+def test_serialize_removes_sep():
+    m = DEFAULT._replace(hose='W%1', reserve_positions='1%2')
+    assert metadata.parse(metadata.serialize(m)) == m._replace(hose='W1', \
+            reserve_positions='12')
+
+
+def test_parse_serialize_stable():
+    rnd = random.Random(0)
+    for i in range(2000):
+        meta = ''.join(rnd.choice('%pthnbrzsq0129|X') for i in range(rnd.randint(0, 20)))
+        parsed = metadata.parse(meta)
+        assert metadata.parse(metadata.serialize(parsed)) == parsed
+
+
+def test_from_dict():
+    base = DEFAULT._replace(hose='W1', size=12)
+    assert metadata.from_dict({'terminal_type': 'FUSE', 'other': 1}, base) == \
+            base._replace(terminal_type='FUSE')
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+# Imports
+import os
+import re
+import xml.etree.ElementTree as etree
+
+import pytest
+
+from src.generator import create_terminal_blocks, iter_blocks, get_head_text
+from src.qetproject import QETProject, ProjectChanged
+from src.scancache import ScanCache
+from src.terminalblock import TerminalBlock
+from tests.projects import read, parse, edit_on_disk
+
+
+
+def generate(project, settings, split=7):
+    return create_terminal_blocks(project, project.terminals, project.tb_names, \
+            split, settings, workers=1)
+
+
+def without_edits(xml, uuids):
+    """Returns the project with the terminal elements in 'uuids' and the
+    terminal blocks removed, what a save can change"""
+
+    element = re.compile(rb'<element [^>]*?uuid="([^"]+)".*?</element>', re.S)
+    xml = element.sub(lambda m: m.group(1) if m.group(1).decode() in uuids \
+            else m.group(0), xml)
+    return re.sub(rb'<element name="TB_[^"]*">.*?</element>', b'', xml, flags=re.S)
+
+
+def canonical(filename):
+    return etree.canonicalize(etree.tostring(parse(filename)))
+
+
+def reference_terminals(filename):
+    """The terminals of the project found on the whole tree, like
+    QETProject did before the streaming load, as
+    (uuid, block, name, xref, cable) sorted by uuid"""
+
+    project = parse(filename)
+    offset = int(project.get('folioSheetQuantity', 0))
+    types = [x.get('name') for x in project.find('collection').iter('element') \
+            if x[0].get('link_type') == 'terminal']
+    ret = []
+    for diagram in project.iter('diagram'):
+        cables = {v: c.get('num') for c in diagram.iter('conductor') \
+                for k, v in c.attrib.items() if k.startswith('terminal')}
+        for element in diagram.iter('element'):
+            infos = {x.get('name'): x.text for x in element.iter('elementInformation')}
+            name = element.findtext('dynamic_texts/dynamic_elmt_text/text') or \
+                    infos.get('label') or infos.get('formula')
+            if ':' not in name or not element.get('type').endswith(tuple(types)):
+                continue
+            ids = [x.get('id') for x in element.iter('terminal')]
+            row = chr(65 + int((int(element.get('y')) - 25) / int(diagram.get('rowsize'))))
+            column = int((int(element.get('x')) - 25) / int(diagram.get('colsize'))) + 1
+            ret.append( (element.get('uuid'), *name.split(':'), \
+                    '{}-{}{}'.format(int(diagram.get('order')) + offset, row, column), \
+                    next((cables[x] for x in ids if x in cables), '')) )
+    return sorted(ret)
+
+
+
+def test_load_same_as_whole_tree(project_file):
+    terminals = QETProject(project_file).terminals
+    assert len(terminals) > 50
+    ret = [(t.uuid, t.block_name, t.terminal_name, t.terminal_xref, t.cable) \
+            for t in terminals]
+    assert sorted(ret) == reference_terminals(project_file)
+
+
+@pytest.mark.parametrize('chunk', [1, 7, 4096])
+def test_load_by_chunks(project_file, monkeypatch, chunk):
+    terminals = QETProject(project_file).terminals
+    monkeypatch.setattr(QETProject, 'READ_CHUNK', chunk)
+    assert QETProject(project_file).terminals == terminals
+
+
+@pytest.mark.parametrize('incremental', [True, False])
+def test_save_keeps_logos(project_file, settings, tmp_path, incremental):
+    logos = re.compile(rb'<logos>.*</logos>', re.S)
+    project = QETProject(project_file)
+    generate(project, settings)
+    output = str(tmp_path / 'output.qet')
+    project.save_tb(output, incremental=incremental)
+    assert logos.search(read(output)).group(0) == logos.search(read(project_file)).group(0)
+
+
+def test_without_logos(project_file, settings):
+    edit_on_disk(project_file, re.search(rb'<logos>.*</logos>', read(project_file), \
+            re.S).group(0), b'')
+    project = QETProject(project_file)
+    generate(project, settings)
+    project.save_tb(project_file, incremental=False)
+    parse(project_file)
+    assert QETProject(project_file).terminals == project.terminals
+
+
+
+@pytest.mark.parametrize('incremental', [True, False])
+def test_insert_bytes_same_as_nodes(project_file, settings, tmp_path, incremental):
+    outputs = []
+    for draw in (TerminalBlock.drawTerminalBlock, TerminalBlock.drawTerminalBlockBytes):
+        project = QETProject(project_file)
+        for name, num, splitted, tb in iter_blocks(project.terminals, \
+                project.tb_names, 7):
+            head_text = get_head_text(name, num, splitted)
+            project.insert_tb(head_text, draw(TerminalBlock(head_text, tb, settings)))
+        outputs.append(str(tmp_path / '{}.qet'.format(draw.__name__)))
+        project.save_tb(outputs[-1], incremental=incremental)
+    assert read(outputs[0]) == read(outputs[1])
+
+
+
+def test_save_incremental_same_as_full(project_file, settings, tmp_path):
+    outputs = {}
+    for incremental in (True, False):
+        source = project_file
+        outputs[incremental] = []
+        for split in (7, 5):  # with the terminal blocks of the 1st save
+            project = QETProject(source)
+            assert generate(project, settings, split)
+            output = str(tmp_path / '{}{}.qet'.format(incremental, split))
+            project.save_tb(output, incremental=incremental)
+            outputs[incremental].append(output)
+            source = output
+
+    for incremental, full in zip(outputs[True], outputs[False]):
+        assert canonical(incremental) == canonical(full)
+        assert QETProject(incremental).terminals == QETProject(full).terminals
+
+
+def test_save_incremental_only_edits(project_file, settings, tmp_path):
+    source = project_file
+    for split in (7, 5):
+        project = QETProject(source)
+        uuids = {t.uuid for t in project.terminals}
+        blocks = generate(project, settings, split)
+        output = str(tmp_path / '{}.qet'.format(split))
+        project.save_tb(output)
+
+        parse(output)
+        assert read(output) != read(source)
+        assert without_edits(read(output), uuids) == without_edits(read(source), uuids)
+        assert read(output).count(b'<element name="TB_') == blocks
+        assert QETProject(output).terminals == project.terminals
+        source = output
+
+
+
+@pytest.mark.parametrize('new', [b'2024-01-01 10:00', b'y'])  # other size, same size
+@pytest.mark.parametrize('incremental', [True, False])
+def test_save_source_changed(project_file, settings, new, incremental):
+    project = QETProject(project_file)
+    edit_on_disk(project_file, b'show="1">x</property>', b'show="1">' + new + b'</property>')
+    changed = read(project_file)
+    generate(project, settings)
+
+    with pytest.raises(ProjectChanged):
+        project.save_tb(project_file, incremental=incremental)
+    assert read(project_file) == changed
+    assert os.listdir(os.path.dirname(project_file)) == ['project.qet']
+
+
+def test_save_twice_over_source(project_file, settings):
+    project = QETProject(project_file)
+    generate(project, settings)
+    project.save_tb(project_file)
+    generate(project, settings, split=5)
+    project.save_tb(project_file)  # the source is the file saved before
+
+    parse(project_file)
+    assert QETProject(project_file).terminals == project.terminals
+
+
+
+def test_save_cached_source_changed(project_file, settings, tmp_path):
+    cache = ScanCache(str(tmp_path / 'cache'))
+    QETProject(project_file, cache=cache)
+    project = QETProject(project_file, cache=cache)  # not parsed
+    edit_on_disk(project_file, b'show="1">x</property>', b'show="1">y</property>')
+    changed = read(project_file)
+    project.ensure_loaded()  # parses the new file
+    generate(project, settings)
+
+    with pytest.raises(ProjectChanged):
+        project.save_tb(project_file)
+    assert read(project_file) == changed
+
+    project = QETProject(project_file, cache=cache)  # read again
+    generate(project, settings)
+    project.save_tb(project_file)
+    parse(project_file)
+
+
+
+def test_save_modes(project_file, settings, tmp_path):
+    umask = os.umask(0o027)
+    try:
+        project = QETProject(project_file)
+        generate(project, settings)
+        output = str(tmp_path / 'new.qet')
+        project.save_tb(output)
+        assert os.stat(output).st_mode & 0o777 == 0o640
+
+        os.chmod(project_file, 0o604)
+        project.save_tb(project_file)
+        assert os.stat(project_file).st_mode & 0o777 == 0o604
+    finally:
+        os.umask(umask)
+
+
+@pytest.mark.parametrize('backup', [None, 'link_1.qet'])
+def test_save_through_symlink(project_file, settings, tmp_path, backup):
+    link = str(tmp_path / 'link.qet')
+    os.symlink(project_file, link)
+    source = read(project_file)
+    project = QETProject(link)
+    generate(project, settings)
+    project.save_tb(link, backup=backup and str(tmp_path / backup))
+
+    assert os.path.islink(link)
+    assert read(project_file) != source
+    parse(project_file)
+    if backup:
+        assert read(str(tmp_path / backup)) == source
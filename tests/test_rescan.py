@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+# Imports
+import re
+
+import pytest
+
+from src.generator import create_terminal_blocks
+from src.qetproject import QETProject
+from src.scancache import ScanCache
+from tests.projects import read, parse
+
+
+
+def folio_span(xml, page):
+    """Returns the span of the <diagram> of a page"""
+
+    start = xml.index('<diagram order="{}"'.format(page).encode())
+    return start, xml.index(b'</diagram>', start) + len(b'</diagram>')
+
+
+def edit_folio(xml, page, old, new):
+    start, end = folio_span(xml, page)
+    folio = xml[start:end]
+    assert re.search(old, folio)
+    return xml[:start] + re.sub(old, new, folio) + xml[end:]
+
+
+def remove_folio(xml, page):
+    start, end = folio_span(xml, page)
+    return xml[:start] + xml[end:].lstrip()
+
+
+def swap_folios(xml, page1, page2):
+    (s1, e1), (s2, e2) = folio_span(xml, page1), folio_span(xml, page2)
+    return xml[:s1] + xml[s2:e2] + xml[e1:s2] + xml[s1:e1] + xml[e2:]
+
+
+# edits of the project and the num of folios parsed again
+EDITS = {
+    'function': (lambda xml: edit_folio(xml, 3, rb'%hW3%', b'%hW33%'), 1),
+    'labels': (lambda xml: edit_folio(xml, 2, rb'>X1:', b'>X7:'), 1),
+    'position': (lambda xml: edit_folio(xml, 4, rb' x="(\d+)"', rb' x="\g<1>0"'), 1),
+    'conductors': (lambda xml: edit_folio(xml, 1, rb'num="(\d+)"', rb'num="W\1"'), 1),
+    'page offset': (lambda xml: xml.replace(b'folioSheetQuantity="1"', \
+            b'folioSheetQuantity="3"'), 0),
+    'removed': (lambda xml: remove_folio(xml, 2), 0),
+    'swapped': (lambda xml: swap_folios(xml, 1, 4), 0),
+    'terminal type': (lambda xml: re.sub(rb'(terminal_fuse.elmt">\s*<definition [^>]*)' \
+            rb'link_type="terminal"', rb'\1link_type="simple"', xml), 0),
+}
+
+
+
+@pytest.fixture
+def counted(monkeypatch):
+    """Counts the folios parsed by QETProject"""
+
+    parsed = []
+    scan = QETProject._scanDiagram
+    def _scanDiagram(self, diagram, digest=None):
+        parsed.append(diagram.get('order'))
+        return scan(self, diagram, digest)
+    monkeypatch.setattr(QETProject, '_scanDiagram', _scanDiagram)
+    return parsed
+
+
+
+@pytest.mark.parametrize('edit', sorted(EDITS))
+def test_rescan_same_as_full_parse(project_file, tmp_path, counted, edit):
+    cache = ScanCache(str(tmp_path / 'cache'))
+    QETProject(project_file, cache=cache)
+    change, num_parsed = EDITS[edit]
+    xml = change(read(project_file))
+    with open(project_file, 'wb') as f:
+        f.write(xml)
+
+    del counted[:]
+    rescanned = QETProject(project_file, cache=cache)
+    assert len(counted) == num_parsed
+    full = QETProject(project_file)
+    assert rescanned.terminals == full.terminals
+    assert rescanned.blocks == full.blocks
+    assert rescanned.get_max_tb_length() == full.get_max_tb_length()
+
+    # cached as a whole again
+    del counted[:]
+    assert QETProject(project_file, cache=cache).terminals == full.terminals
+    assert counted == []
+
+
+def test_rescan_then_save(project_file, settings, tmp_path):
+    cache = ScanCache(str(tmp_path / 'cache'))
+    QETProject(project_file, cache=cache)
+    xml = EDITS['function'][0](read(project_file))
+    with open(project_file, 'wb') as f:
+        f.write(xml)
+    rescanned_file = str(tmp_path / 'rescanned.qet')
+    full_file = str(tmp_path / 'full.qet')
+
+    for project, output in ((QETProject(project_file, cache=cache), rescanned_file), \
+            (QETProject(project_file), full_file)):
+        create_terminal_blocks(project, project.terminals, project.tb_names, 7, \
+                settings)
+        project.save_tb(output)
+    parse(rescanned_file)
+    assert read(rescanned_file) == read(full_file)
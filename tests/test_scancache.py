@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+# Imports
+import os
+
+import pytest
+
+from src.qetproject import QETProject
+from src.scancache import ScanCache
+from tests.projects import edit_on_disk
+
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ScanCache(str(tmp_path / 'cache'), max_entries=2)
+
+
+def write(filename, text):
+    with open(filename, 'w') as f:
+        f.write(text)
+    return filename
+
+
+
+def test_hit(cache, tmp_path):
+    project = write(str(tmp_path / 'a.qet'), 'a')
+    cache.put(project, {'data': 1})
+    assert cache.get(project) == {'data': 1}
+
+    os.utime(project, (1000, 1000))  # saved again, same content
+    assert cache.get(project) == {'data': 1}
+
+
+def test_miss(cache, tmp_path):
+    project = write(str(tmp_path / 'a.qet'), 'a')
+    assert cache.get(project) is None
+    assert cache.get_previous(project) is None
+
+    cache.put(project, {'data': 1})
+    write(project, 'b')  # same size, other content
+    assert cache.get(project) is None
+    assert cache.get_previous(project) == {'data': 1}  # to reuse its folios
+
+    cache.put(project, {'data': 2})
+    write(project, 'bb')
+    assert cache.get(project) is None
+
+
+def test_invalid_files(cache, tmp_path, monkeypatch):
+    project = write(str(tmp_path / 'a.qet'), 'a')
+    cache.put(project, {'data': 1})
+    write(cache._getFile(project), 'not a pickle')
+    assert cache.get(project) is None
+
+    cache.put(project, {'data': 1})
+    monkeypatch.setattr(ScanCache, 'VERSION', ScanCache.VERSION + 1)
+    assert cache.get(project) is None
+
+
+def test_eviction(cache, tmp_path):
+    a, b, c = [write(str(tmp_path / x), x) for x in ('a.qet', 'b.qet', 'c.qet')]
+    cache.put(a, 'a')
+    cache.put(b, 'b')
+    os.utime(cache._getFile(a), (1000, 1000))
+    os.utime(cache._getFile(b), (2000, 2000))
+    assert cache.get(a) == 'a'  # used now, b is the oldest
+
+    cache.put(c, 'c')
+    assert len(os.listdir(cache.folder)) == 2
+    assert cache.get(b) is None
+    assert cache.get(a) == 'a'
+    assert cache.get(c) == 'c'
+
+
+def test_project(cache, project_file):
+    project = QETProject(project_file, cache=cache)
+    assert 'parse' in project.timings
+    cached = QETProject(project_file, cache=cache)
+    assert 'parse' not in cached.timings
+    assert cached.terminals == project.terminals
+    assert cached.blocks == project.blocks
+
+    edit_on_disk(project_file, b'Page 1"', b'Page 01"')
+    changed = QETProject(project_file, cache=cache)
+    assert 'parse' in changed.timings
+    assert changed.terminals == QETProject(project_file).terminals
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+#---------|---------|---------|---------|---------|---------|---------|---------|
+# Copyright (C) 2018 Raul Roda <raulroda@yahoo.com>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#---------|---------|---------|---------|---------|---------|---------|---------|
+
+
+# Imports
+import random
+import xml.etree.ElementTree as etree
+
+import pytest
+
+from src.generator import get_head_text, iter_blocks
+from src.qetproject import QETProject
+from src.terminal import Terminal
+from src.terminalblock import TerminalBlock, _ColumnX
+
+SIZES = ['-CFG_A-', '-CFG_B-', '-CFG_C-', '-CFG_D-', '-CFG_E-', '-CFG_F-', \
+        '-CFG_G-', '-CFG_H-', '-CFG_I-', '-CFG_J-', '-CFG_HEAD_FONT-', \
+        '-CFG_TERMINAL_FONT-', '-CFG_XREF_FONT-', '-CFG_CONDUCTOR_FONT-']
+CHARS = 'abc<>&"\'{}%\x7f ñ€12|'
+
+
+
+def evaluate(ops, x):
+    """Values of the operations recorded by _ColumnX, like _formatColumn"""
+
+    ret = [x]
+    for op, a, b, node in ops:
+        ret.append(op(ret[a], ret[b] if node else b))
+    return ret
+
+
+def assert_same_drawing(name, terminals, settings):
+    elements = etree.tostring(TerminalBlock(name, terminals, settings).drawTerminalBlock())
+    assert TerminalBlock(name, terminals, settings).drawTerminalBlockBytes() == elements
+
+
+
+def test_column_x_ops():
+    ops = []
+    x = _ColumnX(ops, 0)
+    y = (10 - x) * 3 / 7 + 2 * x - x / 4 + (1.5 + x) * x
+    for cursor in (0, 1, 37.5, 120):
+        assert evaluate(ops, cursor)[y.index] == \
+                (10 - cursor) * 3 / 7 + 2 * cursor - cursor / 4 + (1.5 + cursor) * cursor
+    assert str(y) == _ColumnX.MARK + str(y.index)
+
+
+def test_column_x_same_ops_once():
+    ops = []
+    x = _ColumnX(ops, 0)
+    assert (x + 2).index == (x + 2).index
+    assert (x + 2).index != (x + 2.0).index  # int and float differ
+    assert len(ops) == 2
+
+
+@pytest.mark.parametrize('use', [lambda x: x == 1, lambda x: x != 1, \
+        lambda x: x < 1, lambda x: x >= 1, bool, int, float, round, abs, \
+        lambda x: -x, lambda x: x // 2, lambda x: x % 2, lambda x: 2 ** x, \
+        lambda x: 1 / x, lambda x: [0, 1][x], hash])
+def test_column_x_unsupported(use):
+    with pytest.raises(TypeError):
+        use(_ColumnX([], 0))
+
+
+
+def test_bytes_same_as_elements_project(project_file, settings):
+    project = QETProject(project_file)
+    blocks = list(iter_blocks(project.terminals, project.tb_names, 7))
+    assert any(splitted for name, num, splitted, tb in blocks)
+    assert any(t.hose for name, num, splitted, tb in blocks for t in tb)
+    for name, num, splitted, tb in blocks:
+        assert_same_drawing(get_head_text(name, num, splitted), tb, settings)
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_bytes_same_as_elements(settings, seed):
+    rnd = random.Random(seed)
+    text = lambda: ''.join(rnd.choice(CHARS) for i in range(rnd.randint(0, 6)))
+    for key in SIZES:
+        if rnd.random() < 0.5:
+            settings[key] = str(rnd.randint(1, 300))
+    terminals = [Terminal(uuid=str(i), block_name='X1', \
+            terminal_name=rnd.choice([str(i + 1), text()]), terminal_xref=text(), \
+            cable=text(), terminal_pos=i + 1, \
+            terminal_type=rnd.choice(['STANDARD', 'GROUND', 'FUSE', 'ground', 'x']), \
+            hose=rnd.choice(['', '', 'W1', 'W2', text()]), conductor=text(), \
+            bridge=rnd.choice(['', '|'])) for i in range(rnd.randint(1, 40))]
+    assert_same_drawing(rnd.choice(['X1', 'X1(2)', text() or 'Y']), terminals, settings)